@@ -1,16 +1,23 @@
 from qdrant_client import QdrantClient
+import numpy as np
 import os
 
-path = "./qdrant_data"
-os.makedirs(path, exist_ok=True)
-client = QdrantClient(path=path)
+url = os.getenv("QDRANT_URL")
+if url:
+    # Prefer a running Qdrant server over gRPC when one is configured
+    client = QdrantClient(url=url, prefer_grpc=True)
+else:
+    path = "./qdrant_data"
+    os.makedirs(path, exist_ok=True)
+    client = QdrantClient(path=path)
 try:
     # Create dummy collection if needed
     from qdrant_client.http import models
     if not client.collection_exists("test"):
-        client.create_collection("test", vectors_config=models.VectorParams(size=4, distance=models.Distance.COSINE))
+        client.create_collection("test", vectors_config=models.VectorParams(size=4, distance=models.Distance.DOT))
     
-    res = client.query_points(collection_name="test", query=[0.1, 0.1, 0.1, 0.1], limit=1)
+    # Unit-length query vector, matching the DOT distance used by Ragforge
+    res = client.query_points(collection_name="test", query=np.full(4, 0.5, dtype=np.float32), limit=1)
     print(f"Result type: {type(res)}")
     print(f"Result: {res}")
 except Exception as e:
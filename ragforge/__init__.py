@@ -1,17 +1,43 @@
+import importlib
 import logging
 import sys
-from .rag import ask, ingest
+from typing import Any
 
-__all__ = ["ask", "ingest"]
+__all__ = ["ask", "aask", "aask_many", "ask_batch", "ingest", "configure_logging"]
 
-# Configure logging for the package
-def _configure_logging():
-    """Configure basic logging for ragforge package."""
+# Public names resolved on first access (PEP 562), so `import ragforge` does
+# not pull in Qdrant, FastEmbed, Neo4j or Groq until they are needed
+_LAZY_ATTRS = {
+    "ask": "ragforge.rag",
+    "aask": "ragforge.rag",
+    "aask_many": "ragforge.rag",
+    "ask_batch": "ragforge.rag",
+    "ingest": "ragforge.rag",
+}
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure basic logging for ragforge package.
+    
+    Logging is no longer configured on import; call this explicitly from
+    scripts that want ragforge's log output on stdout.
+    
+    Args:
+        level: The logging level to use.
+    """
     logging.basicConfig(
-        level=logging.INFO,
+        level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[logging.StreamHandler(sys.stdout)]
     )
-
-# Configure logging on import
-_configure_logging()
@@ -0,0 +1,237 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ragforge.settings import settings
+from ragforge.errors import ConfigurationError
+
+
+class ProximityCache:
+    """
+    Approximate cache keyed on query embeddings.
+
+    Lookups return the value stored for a previous query whose embedding has a
+    cosine similarity of at least ``threshold`` with the new one. Keys are
+    bucketed with random-projection LSH (the sign pattern of ``vector @ planes``)
+    so a lookup only compares against the few entries sharing its bucket.
+    Entries are evicted in LRU order once ``max_size`` is reached.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        max_size: int = 10000,
+        threshold: float = 0.95,
+        num_planes: int = 16,
+        seed: int = 0
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            dimension: Dimension of the query embeddings.
+            max_size: Maximum number of cached entries.
+            threshold: Minimum cosine similarity for a cache hit.
+            num_planes: Number of random hyperplanes used for LSH bucketing.
+            seed: Seed for the random hyperplanes.
+        """
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((dimension, num_planes)).astype(np.float32)
+        self._max_size = max_size
+        self._threshold = threshold
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._buckets: Dict[bytes, List[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _prepare(self, vector: Any) -> tuple:
+        """Returns the unit-norm float32 vector and its LSH bucket key."""
+        vec = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if norm > 0:
+            vec = vec / norm
+        bucket = np.packbits(vec @ self._planes > 0).tobytes()
+        return vec, bucket
+
+    def get(self, vector: Any) -> Optional[Any]:
+        """
+        Looks up the value cached for a query close to ``vector``.
+
+        Args:
+            vector: The query embedding.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        vec, bucket = self._prepare(vector)
+        with self._lock:
+            candidates = self._buckets.get(bucket)
+            if not candidates:
+                return None
+            keys = np.stack([self._entries[entry_id][0] for entry_id in candidates])
+            scores = keys @ vec
+            best = int(np.argmax(scores))
+            if scores[best] < self._threshold:
+                return None
+            entry_id = candidates[best]
+            self._entries.move_to_end(entry_id)
+            return self._entries[entry_id][2]
+
+    def put(self, vector: Any, value: Any) -> None:
+        """
+        Caches ``value`` for the query embedding ``vector``.
+
+        Args:
+            vector: The query embedding.
+            value: The value to cache.
+        """
+        vec, bucket = self._prepare(vector)
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (vec, bucket, value)
+            self._buckets.setdefault(bucket, []).append(entry_id)
+
+            while len(self._entries) > self._max_size:
+                old_id, (_, old_bucket, _) = self._entries.popitem(last=False)
+                members = self._buckets[old_bucket]
+                members.remove(old_id)
+                if not members:
+                    del self._buckets[old_bucket]
+
+    def clear(self) -> None:
+        """Removes all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """
+    Exact-match cache for raw LLM responses.
+
+    Responses are kept in an in-memory LRU and, when a directory is given,
+    also persisted with ``diskcache`` so repeated runs of the same script can
+    skip the LLM entirely. Entries can optionally expire after ``ttl`` seconds.
+    """
+
+    def __init__(self, max_size: int = 1024, directory: Optional[str] = None, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of in-memory entries.
+            directory: Optional directory for the persistent tier.
+            ttl: Optional lifetime of an entry in seconds.
+
+        Raises:
+            ConfigurationError: If a directory is given but diskcache is not installed.
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+
+        if directory:
+            try:
+                import diskcache
+            except ImportError:
+                raise ConfigurationError(
+                    "A persistent LLM cache requires the 'diskcache' package. "
+                    "Install it with: pip install ragforge[cache]"
+                )
+            self._disk = diskcache.Cache(os.path.expanduser(directory))
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Builds a compact cache key from the given string parts.
+
+        Args:
+            *parts: Strings identifying the request (model, question, context...).
+
+        Returns:
+            A hex digest uniquely identifying the parts.
+        """
+        return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns the cached response for ``key``, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+        if self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                self._remember(key, value)
+            return value
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Caches ``value`` under ``key``.
+        """
+        self._remember(key, value)
+        if self._disk is not None:
+            self._disk.set(key, value, expire=self._ttl)
+
+    def clear(self) -> None:
+        """Removes all cached entries, including the persistent tier."""
+        with self._lock:
+            self._entries.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def _remember(self, key: str, value: str) -> None:
+        """Stores an entry in the in-memory tier, evicting in LRU order."""
+        if self._max_size <= 0:
+            return
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+
+_response_cache = None
+_lock = threading.Lock()
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Returns the singleton LLM response cache.
+    
+    Returns:
+        The shared ResponseCache, or None if response caching is disabled.
+    """
+    global _response_cache
+    # Fast path: once created, the cache is returned without locking
+    cache = _response_cache
+    if cache is not None:
+        return cache
+    if settings.llm_cache_size == 0 and not settings.llm_cache_dir:
+        return None
+    with _lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(
+                max_size=settings.llm_cache_size,
+                directory=settings.llm_cache_dir
+            )
+    return _response_cache
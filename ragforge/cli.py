@@ -0,0 +1,152 @@
+import argparse
+import asyncio
+import sys
+from typing import Dict, List, Optional
+
+from ragforge.settings import settings
+
+# Sample knowledge and questions for `ragforge demo`
+DEMO_PRESETS: Dict[str, Dict[str, List[str]]] = {
+    "basic": {
+        "knowledge": [
+            "GraphRAG is an advanced RAG technique developed by Microsoft Research.",
+            "It combines knowledge graphs with Large Language Models to improve retrieval.",
+            "Standard RAG often fails on global questions that require understanding the whole dataset.",
+            "GraphRAG builds a hierarchical summary of the data using community detection.",
+            "Ragforge is a Python package for zero-config RAG pipelines.",
+            """Shivaji was born in the hill-fort of Shivneri, near Junnar, which is now in Pune district. Scholars disagree on his date of birth; the Government of Maharashtra lists 19 February as a holiday commemorating Shivaji's birth (Shivaji Jayanti).[a][26][27] Shivaji was named after a local deity, the Goddess Shivai Devi.""",
+        ],
+        "questions": [
+            "what is shivaji's birthplace?",
+        ],
+    },
+    "graphrag": {
+        "knowledge": [
+            "Microsoft Research developed GraphRAG, an advanced RAG technique.",
+            "GraphRAG combines knowledge graphs with Large Language Models.",
+            "Shivaji Maharaj was born in Shivneri fort, near Junnar in Pune district.",
+            "Shivaji Maharaj founded the Maratha Empire in the 17th century.",
+            "The Maratha Empire was established in the Deccan region of India.",
+            "GraphRAG improves upon standard RAG by using graph structures.",
+            "Neo4j is a graph database used for storing knowledge graphs.",
+            "Ragforge uses Neo4j for GraphRAG and Qdrant for vector storage.",
+            "nilesh rajgor birthdate is 6 of march 2002",
+            "nilesh rajgor is a software engineer,he joined infusion analyst on 2 january 2023",
+        ],
+        "questions": [
+            "Where was Shivaji Maharaj born?",
+            "What is nilesh rajgor's birthdate?",
+            "What is nilesh rajgor's company?",
+            "What did Microsoft Research develop?",
+            "What is the relationship between GraphRAG and knowledge graphs?",
+            "What databases does Ragforge use?",
+        ],
+    },
+}
+
+_GRAPHRAG_MODES = {"auto": None, "on": True, "off": False}
+
+
+def _require_api_key() -> bool:
+    """Prints an error and returns False if the Groq API key is missing."""
+    if not settings.groq_api_key:
+        print("Error: GROQ_API_KEY environment variable not set.", file=sys.stderr)
+        return False
+    return True
+
+
+def _print_results(questions: List[str], results: List[dict]) -> None:
+    """Prints each question with its answer and supporting facts."""
+    for question, result in zip(questions, results):
+        print(f"Question: {question}")
+        print(f"Answer: {result['answer']}")
+        if result["facts"]:
+            print(f"Facts: {result['facts']}")
+        print("-" * 60)
+
+
+def _cmd_ingest(args: argparse.Namespace) -> int:
+    from ragforge.rag import ingest
+
+    added = ingest(args.texts, use_graphrag=_GRAPHRAG_MODES[args.graphrag])
+    print(f"Ingested {added} new documents ({len(args.texts) - added} already stored or duplicated).")
+    return 0
+
+
+def _cmd_ask(args: argparse.Namespace) -> int:
+    from ragforge.rag import aask_many
+
+    if not _require_api_key():
+        return 1
+    results = asyncio.run(aask_many(args.questions, use_graphrag=_GRAPHRAG_MODES[args.graphrag]))
+    _print_results(args.questions, results)
+    return 0
+
+
+def _cmd_demo(args: argparse.Namespace) -> int:
+    from ragforge.rag import ask_batch, ingest
+
+    if not _require_api_key():
+        return 1
+    preset = DEMO_PRESETS[args.preset]
+    use_graphrag = _GRAPHRAG_MODES[args.graphrag]
+
+    # Ingestion and all questions share one process, so the embedding model
+    # and client connections are set up only once
+    print("Ingesting knowledge...")
+    ingest(preset["knowledge"], use_graphrag=use_graphrag)
+    print("Ingestion complete.\n")
+
+    # The questions are known up front, so answer them with one LLM call
+    results = ask_batch(preset["questions"], use_graphrag=use_graphrag)
+    _print_results(preset["questions"], results)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser for the ``ragforge`` command.
+
+    Returns:
+        The configured ArgumentParser.
+    """
+    parser = argparse.ArgumentParser(prog="ragforge", description="Zero-config RAG and GraphRAG.")
+    parser.add_argument(
+        "--graphrag",
+        choices=sorted(_GRAPHRAG_MODES),
+        default="auto",
+        help="Use GraphRAG (default: auto-detect Neo4j)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = subparsers.add_parser("ingest", help="Add documents to the knowledge base")
+    ingest_parser.add_argument("texts", nargs="+", help="Documents to ingest")
+    ingest_parser.set_defaults(func=_cmd_ingest)
+
+    ask_parser = subparsers.add_parser("ask", help="Answer one or more questions")
+    ask_parser.add_argument("questions", nargs="+", help="Questions to answer")
+    ask_parser.set_defaults(func=_cmd_ask)
+
+    demo_parser = subparsers.add_parser("demo", help="Ingest sample data and answer sample questions")
+    demo_parser.add_argument("--preset", choices=sorted(DEMO_PRESETS), default="basic")
+    demo_parser.set_defaults(func=_cmd_demo)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point for the ``ragforge`` command.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``).
+
+    Returns:
+        The process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,19 @@
-from ragforge.graph.neo4j_store import GraphStore
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ragforge.graph.neo4j_store import GraphStore
 
 _graph_instance = None
+_lock = threading.Lock()
 
-def get_graph_store() -> GraphStore:
+def get_graph_store() -> "GraphStore":
     """
     Returns the singleton instance of the GraphStore.
     
     This function ensures only one GraphStore instance is created,
     reusing the same Neo4j connection across the application.
+    The Neo4j driver is only imported on the first call.
     
     If Neo4j is unavailable, returns a GraphStore instance with driver=None,
     which gracefully falls back to vector-only RAG.
@@ -16,8 +22,20 @@ def get_graph_store() -> GraphStore:
         GraphStore: The singleton graph store instance (may have driver=None if Neo4j unavailable).
     """
     global _graph_instance
-    if _graph_instance is None:
-        _graph_instance = GraphStore()
+    # Fast path: once created, the instance is returned without locking
+    graph_store = _graph_instance
+    if graph_store is not None:
+        return graph_store
+    with _lock:
+        if _graph_instance is None:
+            from ragforge.graph.neo4j_store import GraphStore
+            _graph_instance = GraphStore()
     return _graph_instance
 
+def __getattr__(name: str) -> Any:
+    if name == "GraphStore":
+        from ragforge.graph.neo4j_store import GraphStore
+        return GraphStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = ["GraphStore", "get_graph_store"]
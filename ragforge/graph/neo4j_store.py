@@ -1,15 +1,223 @@
+import atexit
+import hashlib
 import logging
 import json
-from typing import List, Dict, Any, Optional, Set
-from neo4j import GraphDatabase, Driver
-from neo4j.exceptions import ServiceUnavailable, AuthError
+import re
+import textwrap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Set, Iterator, Tuple
+from neo4j import GraphDatabase, Driver, ManagedTransaction, Session
+from neo4j.exceptions import ServiceUnavailable, AuthError, ClientError
 
+from ragforge.cache import ResponseCache, get_response_cache
 from ragforge.settings import settings
 from ragforge.llm import get_default_llm
+from ragforge.llm._json_utils import parse_llm_json
+from ragforge.graph.ner import find_named_entities
 from ragforge.errors import GraphError, ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of rows sent in a single UNWIND write
+WRITE_BATCH_SIZE = 1000
+
+# Cached graph contexts per GraphStore, and their lifetime in seconds
+GRAPH_CONTEXT_CACHE_SIZE = 1024
+GRAPH_CONTEXT_CACHE_TTL = 600
+
+# Seconds before checking again whether Community nodes exist, so summaries
+# built by another process are picked up
+COMMUNITY_CHECK_TTL = 60
+
+# Part of the extraction cache key; bump it when extraction results should
+# no longer be replayed, e.g. after changing how responses are parsed
+EXTRACTION_CACHE_VERSION = "1"
+
+# Words shorter than this are matched exactly in entity lookups; fuzzy
+# matching them would hit almost any short name
+MIN_FUZZY_WORD_LENGTH = 5
+
+# Relationship descriptions are cut to this many characters before storage
+MAX_DESCRIPTION_CHARS = 120
+
+# Writes with more rows than this are committed in chunks by apoc.periodic.iterate
+APOC_ITERATE_THRESHOLD = 500
+
+# Per-row write statements; ``row`` is bound by UNWIND or by apoc.periodic.iterate
+MERGE_ENTITY_STATEMENT = """
+    MERGE (e:Entity {id: row.id})
+    ON CREATE SET e.created = timestamp()
+    SET e.name = row.name,
+        e.type = row.type,
+        e.last_seen = timestamp()
+"""
+
+MERGE_RELATIONSHIP_STATEMENT = """
+    MATCH (source:Entity {id: row.source_id})
+    MATCH (target:Entity {id: row.target_id})
+    MERGE (source)-[r:RELATES_TO {type: row.rel_type}]->(target)
+    ON CREATE SET r.created = timestamp()
+    SET r.description = coalesce(row.description, r.description),
+        r.last_seen = timestamp()
+"""
+
+# Marks a document as processed, so ingesting it again skips the extraction
+MERGE_DOCUMENT_STATEMENT = """
+    MERGE (d:Document {id: row.id})
+    ON CREATE SET d.created = timestamp()
+"""
+
+MERGE_ENTITIES_QUERY = "UNWIND $rows AS row" + MERGE_ENTITY_STATEMENT
+
+MERGE_RELATIONSHIPS_QUERY = "UNWIND $rows AS row" + MERGE_RELATIONSHIP_STATEMENT
+
+MERGE_DOCUMENTS_QUERY = "UNWIND $rows AS row" + MERGE_DOCUMENT_STATEMENT
+
+# IDs among $ids whose documents are already in the graph
+STORED_DOCUMENTS_QUERY = """
+    UNWIND $ids AS id
+    MATCH (d:Document {id: id})
+    RETURN d.id AS id
+"""
+
+PERIODIC_ITERATE_QUERY = """
+    CALL apoc.periodic.iterate(
+        'UNWIND $rows AS row RETURN row',
+        $statement,
+        {batchSize: $batch_size, parallel: false, params: {rows: $rows}}
+    )
+    YIELD failedBatches, errorMessages
+    RETURN failedBatches, errorMessages
+"""
+
+# All entity relationships, used to project the graph for community detection
+RELATIONSHIPS_QUERY = """
+    MATCH (source:Entity)-[r:RELATES_TO]->(target:Entity)
+    RETURN source.id AS source_id,
+           source.name AS source_name,
+           target.id AS target_id,
+           target.name AS target_name,
+           r.type AS type,
+           r.description AS description
+"""
+
+# Deletes the whole graph in chunks so large graphs do not build one huge transaction
+CLEAR_GRAPH_QUERY = """
+    MATCH (n)
+    CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+# Entities whose names match any of the full-text $terms, with their neighbors
+RELATED_ENTITIES_QUERY = """
+    UNWIND range(0, size($terms) - 1) AS rank
+    CALL db.index.fulltext.queryNodes('entity_fulltext', $terms[rank], {limit: $limit})
+    YIELD node AS e, score
+    WITH e, min(rank) AS rank, max(score) AS score
+    OPTIONAL MATCH (e)-[r:RELATES_TO]-(related:Entity)
+    RETURN e.name AS entity_name,
+           e.type AS entity_type,
+           collect(DISTINCT {
+               related: related.name,
+               relation: r.type,
+               description: r.description
+           }) AS relationships,
+           rank,
+           score
+    ORDER BY rank, score DESC
+    LIMIT $limit
+"""
+
+WRITE_COMMUNITIES_QUERY = """
+    UNWIND $rows AS row
+    CREATE (c:Community {id: row.id, level: 0, summary: row.summary, created: timestamp()})
+    WITH c, row
+    UNWIND row.members AS member_id
+    MATCH (e:Entity {id: member_id})
+    MERGE (c)-[:CONTAINS]->(e)
+"""
+
+# Full-text scores are not normalized, so summaries are compared with the
+# best hit: those scoring below this fraction of it are dropped
+COMMUNITY_SCORE_RATIO = 0.5
+
+# Community summaries matching the question's terms, best match first
+COMMUNITY_SUMMARIES_QUERY = """
+    CALL db.index.fulltext.queryNodes('community_summary_english', $terms, {limit: $limit})
+    YIELD node, score
+    WHERE score >= $min_score
+    RETURN node.summary AS summary, score
+    ORDER BY score DESC
+"""
+
+COMMUNITY_SUMMARY_PROMPT = """Summarize the following group of related entities and their relationships
+in a short paragraph. Mention the entities by name and state only what the relationships say.
+
+Relationships:
+{relationships}
+
+Summary:"""
+
+
+def _document_id(text: str) -> str:
+    """Derives a stable document ID from the text content."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _iter_batches(rows: List[Dict[str, Any]], size: int = WRITE_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """Yields consecutive slices of at most ``size`` rows."""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _split_text(text: str, max_chars: int) -> List[str]:
+    """
+    Splits text into pieces of at most ``max_chars``, packing whole paragraphs
+    together and wrapping any single paragraph that is too long by itself.
+    """
+    chunks: List[str] = []
+    current = ""
+    for paragraph in text.split("\n\n"):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        pieces = textwrap.wrap(paragraph, max_chars) if len(paragraph) > max_chars else [paragraph]
+        for piece in pieces:
+            if current and len(current) + 2 + len(piece) > max_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _read_query(query: str) -> str:
+    """Prefixes a read-only query with the parallel runtime hint when it is enabled."""
+    if settings.neo4j_parallel_runtime:
+        return "CYPHER runtime=parallel " + query
+    return query
+
+
+def _shorten_description(description: str) -> Optional[str]:
+    """Cuts a relationship description to MAX_DESCRIPTION_CHARS at a word boundary; None if empty."""
+    description = " ".join(description.split())
+    if not description:
+        return None
+    if len(description) > MAX_DESCRIPTION_CHARS:
+        description = description[:MAX_DESCRIPTION_CHARS].rsplit(" ", 1)[0]
+    return description
+
+
+def _run_unwind_batches(tx: ManagedTransaction, writes: List[Tuple[str, List[Dict[str, Any]]]]) -> None:
+    """Runs each (query, rows) write as UNWIND batches inside one managed transaction."""
+    for query, rows in writes:
+        for batch in _iter_batches(rows):
+            tx.run(query, {"rows": batch}).consume()
+
+
 class GraphStore:
     """
     Manages the Neo4j knowledge graph for GraphRAG functionality.
@@ -20,6 +228,9 @@ class GraphStore:
     - Relationship extraction
     - Graph construction and querying
     - Hybrid retrieval (graph + vector)
+    
+    Extracted entities and relationships are buffered and written with
+    batched UNWIND queries by flush().
     """
     
     def __init__(self):
@@ -28,6 +239,23 @@ class GraphStore:
         Silently falls back if Neo4j is unavailable - no errors or warnings.
         """
         self.driver = None
+        self._entity_rows: List[Dict[str, Any]] = []
+        self._rel_rows: List[Dict[str, Any]] = []
+        self._document_rows: List[Dict[str, Any]] = []
+        self._buffer_lock = threading.Lock()
+        self._community_lock = threading.Lock()
+        # Background rebuild state: one running worker, at most one rebuild queued
+        self._rebuild_lock = threading.Lock()
+        self._rebuild_pending = False
+        self._rebuild_thread: Optional[threading.Thread] = None
+        self._apoc_available: Optional[bool] = None
+        # Caps concurrent extraction LLM calls across documents and their
+        # chunks, which run in nested thread pools
+        self._extraction_slots = threading.BoundedSemaphore(settings.entity_extraction_concurrency)
+        # Whether Community nodes exist, and when that was last checked
+        self._has_communities = False
+        self._communities_checked: Optional[float] = None
+        self._context_cache = ResponseCache(max_size=GRAPH_CONTEXT_CACHE_SIZE, ttl=GRAPH_CONTEXT_CACHE_TTL)
         
         # If explicitly disabled, skip initialization
         if settings.enable_graphrag is False:
@@ -41,11 +269,15 @@ class GraphStore:
         try:
             self.driver = GraphDatabase.driver(
                 settings.neo4j_uri,
-                auth=(settings.neo4j_user, settings.neo4j_password)
+                auth=(settings.neo4j_user, settings.neo4j_password),
+                max_connection_pool_size=settings.neo4j_pool_size
             )
             # Verify connection
             self.driver.verify_connectivity()
-            logger.debug(f"GraphRAG enabled: Connected to Neo4j at {settings.neo4j_uri}")
+            logger.debug("GraphRAG enabled: Connected to Neo4j at %s", settings.neo4j_uri)
+            
+            # Keep the pooled connections for the life of the process
+            atexit.register(self.close)
             
             # Initialize schema
             self._initialize_schema()
@@ -54,6 +286,23 @@ class GraphStore:
             # Silently fail - fallback to standard RAG
             self.driver = None
     
+    @contextmanager
+    def session(self, **config: Any) -> Iterator[Session]:
+        """
+        Open a session on the shared driver's connection pool.
+        
+        The database is always named explicitly so the driver skips the
+        home-database lookup when the session starts.
+        
+        Args:
+            **config: Extra session options, such as ``fetch_size``.
+        
+        Yields:
+            A Neo4j session, closed (and its connection returned to the pool) on exit.
+        """
+        with self.driver.session(database=settings.neo4j_database, **config) as session:
+            yield session
+    
     def _initialize_schema(self):
         """
         Initialize the graph schema with constraints and indexes.
@@ -61,13 +310,18 @@ class GraphStore:
         if not self.driver:
             return
             
-        with self.driver.session(database=settings.neo4j_database) as session:
+        with self.session() as session:
             # Create constraints for uniqueness
             session.run("""
                 CREATE CONSTRAINT entity_id IF NOT EXISTS
                 FOR (e:Entity) REQUIRE e.id IS UNIQUE
             """)
             
+            session.run("""
+                CREATE CONSTRAINT document_id IF NOT EXISTS
+                FOR (d:Document) REQUIRE d.id IS UNIQUE
+            """)
+            
             # Create indexes for better query performance
             session.run("""
                 CREATE INDEX entity_name IF NOT EXISTS
@@ -79,28 +333,88 @@ class GraphStore:
                 FOR (e:Entity) ON (e.type)
             """)
             
+            # Query entities are matched to stored names by full-text search
+            session.run("""
+                CREATE FULLTEXT INDEX entity_fulltext IF NOT EXISTS
+                FOR (e:Entity) ON EACH [e.name]
+            """)
+            
+            # Community summaries are looked up by full-text search at query time
+            session.run("""
+                CREATE CONSTRAINT community_id IF NOT EXISTS
+                FOR (c:Community) REQUIRE c.id IS UNIQUE
+            """)
+            
+            # The english analyzer drops stop words, so "where" or "was" in a
+            # question cannot match every summary
+            session.run("""
+                CREATE FULLTEXT INDEX community_summary_english IF NOT EXISTS
+                FOR (c:Community) ON EACH [c.summary]
+                OPTIONS {indexConfig: {`fulltext.analyzer`: 'english'}}
+            """)
+            
             logger.debug("Neo4j schema initialized")
     
     def extract_entities_and_relationships(self, text: str) -> Dict[str, Any]:
         """
         Extract entities and relationships from text using LLM.
         
+        Texts longer than ``settings.max_extraction_chars`` are split on
+        paragraph boundaries and the pieces are extracted concurrently, then
+        merged. Across all callers, at most ``settings.entity_extraction_concurrency``
+        extraction LLM calls run at once.
+        
         Args:
             text: The text to extract entities and relationships from.
             
         Returns:
             Dictionary with 'entities' and 'relationships' keys.
+            
+        Raises:
+            GraphError: If the LLM call fails or its response is not valid JSON.
         """
         if not self.driver:
             return {"entities": [], "relationships": []}
         
+        if len(text) <= settings.max_extraction_chars:
+            return self._extract(text)
+        
+        chunks = _split_text(text, settings.max_extraction_chars)
+        workers = min(settings.entity_extraction_concurrency, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            extractions = list(pool.map(self._extract, chunks))
+        
+        # An entity found in several chunks is kept once
+        entities: Dict[tuple, Dict[str, Any]] = {}
+        relationships: List[Dict[str, Any]] = []
+        for extracted in extractions:
+            for entity in extracted["entities"]:
+                key = (str(entity.get("type", "OTHER")).upper(), str(entity.get("name", "")).strip())
+                entities.setdefault(key, entity)
+            relationships.extend(extracted["relationships"])
+        
+        return {"entities": list(entities.values()), "relationships": relationships}
+    
+    def _extract(self, text: str) -> Dict[str, Any]:
+        """Extract entities and relationships from a single LLM-sized piece of text."""
+        # Optional spaCy pass: texts without named entities skip the LLM call,
+        # and the ones found are passed on as a hint
+        entity_hint = ""
+        if settings.entity_prefilter:
+            named_entities = find_named_entities(text)
+            if not named_entities:
+                return {"entities": [], "relationships": []}
+            entity_hint = "\nNamed entities already detected (may be incomplete): " + ", ".join(
+                f"{name} ({label})" for name, label in named_entities
+            ) + "\n"
+        
         llm = get_default_llm()
         
         extraction_prompt = f"""Extract entities and relationships from the following text.
 
 Text:
 {text}
-
+{entity_hint}
 Extract:
 1. Entities: People, places, organizations, concepts, objects mentioned
 2. Relationships: How these entities relate to each other
@@ -112,7 +426,7 @@ Return a JSON object with this structure:
         ...
     ],
     "relationships": [
-        {{"source": "Entity1", "target": "Entity2", "type": "RELATIONSHIP_TYPE", "description": "brief description"}},
+        {{"source": "Entity1", "target": "Entity2", "type": "RELATIONSHIP_TYPE", "description": "a few words, only if the type needs qualifying"}},
         ...
     ]
 }}
@@ -124,45 +438,96 @@ Be concise and accurate."""
 Return only valid JSON. Do not include any explanations or markdown formatting."""
 
         try:
-            response = llm.generate_response(extraction_prompt, system_prompt)
+            # Re-ingested documents and repeated queries reuse the earlier
+            # extraction; the key covers the whole prompt, so the prefilter's
+            # entity hint changes it
+            response_cache = get_response_cache()
+            cache_key = None
+            response = None
+            if response_cache is not None:
+                cache_key = ResponseCache.make_key(
+                    settings.llm_model, "entity_extraction", EXTRACTION_CACHE_VERSION,
+                    system_prompt, extraction_prompt
+                )
+                response = response_cache.get(cache_key)
             
-            # Clean JSON response
-            cleaned = response.strip()
-            if cleaned.startswith("```json"):
-                cleaned = cleaned[7:]
-            if cleaned.startswith("```"):
-                cleaned = cleaned[3:]
-            if cleaned.endswith("```"):
-                cleaned = cleaned[:-3]
+            if response is None:
+                with self._extraction_slots:
+                    response = llm.generate_response(extraction_prompt, system_prompt, json_mode=True)
             
-            result = json.loads(cleaned)
+            result = parse_llm_json(response)
             
             # Validate structure
             if "entities" not in result:
                 result["entities"] = []
             if "relationships" not in result:
                 result["relationships"] = []
+            
+            # Only parseable extractions are worth replaying
+            if cache_key is not None:
+                response_cache.set(cache_key, response)
                 
             return result
             
         except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse entity extraction response: {e}")
-            return {"entities": [], "relationships": []}
+            logger.warning("Failed to parse entity extraction response: %s", e)
+            raise GraphError(f"Entity extraction returned invalid JSON: {e}")
         except Exception as e:
-            logger.error(f"Error extracting entities: {e}")
-            return {"entities": [], "relationships": []}
+            logger.error("Error extracting entities: %s", e)
+            raise GraphError(f"Entity extraction failed: {e}")
     
-    def add_document_to_graph(self, text: str, doc_id: Optional[str] = None) -> None:
+    def filter_new_texts(self, texts: List[str]) -> List[str]:
+        """
+        Returns the texts whose entities have not been added to the graph yet.
+        
+        A text counts as added once add_document_to_graph() processed it and
+        the result was flushed, so texts first ingested without GraphRAG, or
+        whose extraction failed, are returned again. Duplicates within
+        ``texts`` are dropped as well.
+        
+        Args:
+            texts: List of string documents.
+            
+        Returns:
+            The unique texts not yet in the graph, in input order.
+            
+        Raises:
+            GraphError: If the graph cannot be queried.
+        """
+        if not self.driver or not texts:
+            return []
+        
+        ids_by_text = {text: _document_id(text) for text in texts}
+        try:
+            with self.session() as session:
+                result = session.run(STORED_DOCUMENTS_QUERY, {"ids": list(ids_by_text.values())})
+                stored_ids = {record["id"] for record in result}
+        except Exception as e:
+            logger.error("Error checking stored documents: %s", e)
+            raise GraphError(f"Failed to check stored documents: {e}")
+        return [text for text, doc_id in ids_by_text.items() if doc_id not in stored_ids]
+    
+    def add_document_to_graph(self, text: str, doc_id: Optional[str] = None, flush: bool = True) -> None:
         """
         Add a document to the knowledge graph by extracting and storing entities and relationships.
         
+        The document is recorded as a (:Document) node along with its entities,
+        so filter_new_texts() can skip it later.
+        
         Args:
             text: The document text to process.
-            doc_id: Optional document identifier.
+            doc_id: Optional document identifier (defaults to a hash of the text).
+            flush: Write the buffered rows immediately. Pass False when adding many
+                documents and call flush() once at the end.
+                
+        Raises:
+            GraphError: If extraction fails; the document is not recorded then.
         """
         if not self.driver:
             return
         
+        document_row = {"id": doc_id or _document_id(text)}
+        
         try:
             # Extract entities and relationships
             extracted = self.extract_entities_and_relationships(text)
@@ -170,86 +535,152 @@ Return only valid JSON. Do not include any explanations or markdown formatting."
             relationships = extracted.get("relationships", [])
             
             if not entities and not relationships:
-                logger.debug(f"No entities or relationships extracted from document")
+                logger.debug("No entities or relationships extracted from document")
+                with self._buffer_lock:
+                    self._document_rows.append(document_row)
+                if flush:
+                    self.flush()
                 return
             
-            with self.driver.session(database=settings.neo4j_database) as session:
-                # Create or update entities
-                for entity in entities:
-                    entity_name = entity.get("name", "").strip()
-                    entity_type = entity.get("type", "OTHER").upper()
-                    
-                    if not entity_name:
-                        continue
-                    
-                    # Create unique ID for entity
-                    entity_id = f"{entity_type}:{entity_name}"
-                    
-                    session.run("""
-                        MERGE (e:Entity {id: $entity_id})
-                        SET e.name = $name,
-                            e.type = $type,
-                            e.last_seen = timestamp()
-                        ON CREATE SET e.created = timestamp()
-                    """, {
-                        "entity_id": entity_id,
-                        "name": entity_name,
-                        "type": entity_type
-                    })
+            # Keyed by entity ID so an entity the LLM lists twice is merged once
+            entity_rows: Dict[str, Dict[str, Any]] = {}
+            for entity in entities:
+                entity_name = entity.get("name", "").strip()
+                entity_type = entity.get("type", "OTHER").upper()
                 
-                # Create relationships
-                for rel in relationships:
-                    source_name = rel.get("source", "").strip()
-                    target_name = rel.get("target", "").strip()
-                    rel_type = rel.get("type", "RELATED_TO").upper().replace(" ", "_")
-                    description = rel.get("description", "").strip()
-                    
-                    if not source_name or not target_name:
-                        continue
-                    
-                    # Find actual entity IDs by name
-                    source_result = session.run("""
-                        MATCH (e:Entity {name: $name})
-                        RETURN e.id as id
-                        LIMIT 1
-                    """, {"name": source_name})
-                    
-                    source_record = source_result.single()
-                    if not source_record:
-                        continue  # Skip if source entity doesn't exist
-                    source_id = source_record["id"]
-                    
-                    target_result = session.run("""
-                        MATCH (e:Entity {name: $name})
-                        RETURN e.id as id
-                        LIMIT 1
-                    """, {"name": target_name})
-                    
-                    target_record = target_result.single()
-                    if not target_record:
-                        continue  # Skip if target entity doesn't exist
-                    target_id = target_record["id"]
-                    
-                    # Create relationship
-                    session.run("""
-                        MATCH (source:Entity {id: $source_id})
-                        MATCH (target:Entity {id: $target_id})
-                        MERGE (source)-[r:RELATES_TO {type: $rel_type}]->(target)
-                        SET r.description = $description,
-                            r.last_seen = timestamp()
-                        ON CREATE SET r.created = timestamp()
-                    """, {
-                        "source_id": source_id,
-                        "target_id": target_id,
-                        "rel_type": rel_type,
-                        "description": description
-                    })
+                if not entity_name:
+                    continue
                 
-                logger.info(f"Added {len(entities)} entities and {len(relationships)} relationships to graph")
+                # Create unique ID for entity
+                entity_id = f"{entity_type}:{entity_name}"
+                entity_rows[entity_id] = {
+                    "id": entity_id,
+                    "name": entity_name,
+                    "type": entity_type
+                }
+            
+            # Resolve relationship endpoints to entity IDs client-side instead
+            # of looking every name up in Neo4j
+            ids_by_name = {row["name"]: row["id"] for row in entity_rows.values()}
+            
+            # Keyed by (source, target, type), matching the MERGE pattern
+            rel_rows: Dict[tuple, Dict[str, Any]] = {}
+            for rel in relationships:
+                source_id = ids_by_name.get(rel.get("source", "").strip())
+                target_id = ids_by_name.get(rel.get("target", "").strip())
+                
+                if not source_id or not target_id:
+                    continue  # Skip if an endpoint is not an extracted entity
+                
+                rel_type = rel.get("type", "RELATED_TO").upper().replace(" ", "_")
+                rel_rows[(source_id, target_id, rel_type)] = {
+                    "source_id": source_id,
+                    "target_id": target_id,
+                    "rel_type": rel_type,
+                    "description": _shorten_description(rel.get("description") or "")
+                }
+            
+            with self._buffer_lock:
+                self._entity_rows.extend(entity_rows.values())
+                self._rel_rows.extend(rel_rows.values())
+                self._document_rows.append(document_row)
+            
+            logger.debug("Queued %d entities and %d relationships for graph", len(entity_rows), len(rel_rows))
                 
         except Exception as e:
-            logger.error(f"Error adding document to graph: {e}")
+            logger.error("Error adding document to graph: %s", e)
             raise GraphError(f"Failed to add document to graph: {e}")
+        
+        if flush:
+            self.flush()
+    
+    def flush(self) -> None:
+        """
+        Write all buffered entities, relationships and document markers to Neo4j.
+        
+        Entities are merged before relationships so that relationships can
+        resolve endpoints from any document in the batch, and documents are
+        marked last, so a failed write leaves them to be extracted again. Rows are sent with
+        one UNWIND query per WRITE_BATCH_SIZE rows inside a single managed
+        transaction, or through apoc.periodic.iterate when there are more
+        than APOC_ITERATE_THRESHOLD.
+        
+        Raises:
+            GraphError: If writing to Neo4j fails.
+        """
+        if not self.driver:
+            return
+        
+        with self._buffer_lock:
+            entity_rows, self._entity_rows = self._entity_rows, []
+            rel_rows, self._rel_rows = self._rel_rows, []
+            document_rows, self._document_rows = self._document_rows, []
+        
+        if not entity_rows and not rel_rows and not document_rows:
+            return
+        
+        writes = [
+            (MERGE_ENTITY_STATEMENT, MERGE_ENTITIES_QUERY, entity_rows),
+            (MERGE_RELATIONSHIP_STATEMENT, MERGE_RELATIONSHIPS_QUERY, rel_rows),
+            (MERGE_DOCUMENT_STATEMENT, MERGE_DOCUMENTS_QUERY, document_rows),
+        ]
+        
+        try:
+            with self.session() as session:
+                # UNWIND batches share one managed transaction (one commit);
+                # entities must still be committed before relationships use them
+                pending: List[Tuple[str, List[Dict[str, Any]]]] = []
+                for statement, unwind_query, rows in writes:
+                    if not rows:
+                        continue
+                    if len(rows) > APOC_ITERATE_THRESHOLD and self._apoc_available is not False:
+                        if pending:
+                            session.execute_write(_run_unwind_batches, pending)
+                            pending = []
+                        if self._write_periodic(session, statement, rows):
+                            continue
+                    pending.append((unwind_query, rows))
+                
+                if pending:
+                    session.execute_write(_run_unwind_batches, pending)
+            
+            self._context_cache.clear()
+            logger.info("Added %d entities and %d relationships to graph", len(entity_rows), len(rel_rows))
+            
+        except Exception as e:
+            logger.error("Error writing to graph: %s", e)
+            raise GraphError(f"Failed to write to graph: {e}")
+    
+    def _write_periodic(self, session: Session, statement: str, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Write rows with apoc.periodic.iterate, committing every WRITE_BATCH_SIZE rows.
+        
+        Args:
+            session: The session to write with.
+            statement: The per-row write statement.
+            rows: The rows to write.
+            
+        Returns:
+            True if the rows were written, False if APOC is not installed.
+        """
+        try:
+            # apoc.periodic.iterate manages its own transactions, so it runs auto-commit
+            record = session.run(PERIODIC_ITERATE_QUERY, {
+                "statement": statement,
+                "batch_size": WRITE_BATCH_SIZE,
+                "rows": rows
+            }).single()
+        except ClientError as e:
+            if "ProcedureNotFound" not in (e.code or ""):
+                raise
+            logger.debug("APOC is not installed, writing large batches with UNWIND")
+            self._apoc_available = False
+            return False
+        
+        self._apoc_available = True
+        if record and record["failedBatches"]:
+            raise GraphError(f"apoc.periodic.iterate failed: {record['errorMessages']}")
+        return True
     
     def query_related_entities(self, query_text: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -268,64 +699,241 @@ Return only valid JSON. Do not include any explanations or markdown formatting."
         
         try:
             # Extract entities from query
-            extracted = self.extract_entities_and_relationships(query_text)
+            try:
+                extracted = self.extract_entities_and_relationships(query_text)
+            except GraphError:
+                # Fall back to matching the question's own words below
+                extracted = {}
             query_entities = [e.get("name", "").strip() for e in extracted.get("entities", [])]
+            query_entities = [name for name in query_entities if name]
             
             if not query_entities:
                 # Fallback: search by text similarity in entity names
                 query_entities = [query_text]
             
-            results = []
-            
-            with self.driver.session(database=settings.neo4j_database) as session:
-                for entity_name in query_entities[:3]:  # Limit to top 3 entities
-                    # Find matching entities and their neighbors
-                    query = """
-                        MATCH (e:Entity)
-                        WHERE toLower(e.name) CONTAINS toLower($entity_name)
-                        OPTIONAL MATCH (e)-[r:RELATES_TO]-(related:Entity)
-                        RETURN e.name as entity_name,
-                               e.type as entity_type,
-                               collect(DISTINCT {
-                                   related: related.name,
-                                   relation: r.type,
-                                   description: r.description
-                               }) as relationships
-                        LIMIT $limit
-                    """
-                    
-                    result = session.run(query, {
-                        "entity_name": entity_name,
-                        "limit": limit
+            # Plain words only, so names cannot inject Lucene query syntax; the
+            # index lowercases, and ~1 tolerates a typo in longer words. Words
+            # are ORed, so the index score decides which entities match best
+            terms = []
+            for name in query_entities[:3]:  # Limit to top 3 entities
+                # Lowercased so words like "AND" or "NOT" are not read as operators
+                words = re.findall(r"\w+", name.lower())
+                if words:
+                    terms.append(" ".join(
+                        f"{word}~1" if len(word) >= MIN_FUZZY_WORD_LENGTH else word
+                        for word in words
+                    ))
+            if not terms:
+                return []
+            
+            # One round trip for all names; entities matching earlier names rank first
+            # Never pull more records than the caller can use
+            with self.session(fetch_size=limit) as session:
+                result = session.run(_read_query(RELATED_ENTITIES_QUERY), {
+                    "terms": terms,
+                    "limit": limit
+                })
+                
+                # Deduplicate, keeping the best-ranked occurrence
+                unique_results: Dict[tuple, Dict[str, Any]] = {}
+                for record in result:
+                    unique_results.setdefault((record["entity_name"], record["entity_type"]), {
+                        "entity": record["entity_name"],
+                        "type": record["entity_type"],
+                        "relationships": record["relationships"]
                     })
+            
+            return list(unique_results.values())[:limit]
+            
+        except Exception as e:
+            logger.error("Error querying graph: %s", e)
+            return []
+    
+    def build_community_summaries(self, min_community_size: int = 2) -> int:
+        """
+        Detect entity communities and store an LLM-written summary for each.
+        
+        The whole relationship graph is read with a single query, communities
+        are detected client-side with Louvain (networkx), and each community
+        is summarized once and stored as a (:Community)-[:CONTAINS]->(:Entity)
+        node. Previously built communities are replaced.
+        
+        Args:
+            min_community_size: Smallest number of entities worth summarizing.
+            
+        Returns:
+            The number of communities written.
+            
+        Raises:
+            ConfigurationError: If networkx is not installed.
+            GraphError: If reading or writing the graph fails.
+        """
+        if not self.driver:
+            return 0
+        
+        try:
+            import networkx as nx
+        except ImportError:
+            raise ConfigurationError(
+                "Community summaries require the 'networkx' package. "
+                "Install it with: pip install ragforge[communities]"
+            )
+        
+        with self._community_lock:
+            try:
+                with self.session() as session:
+                    edges = session.run(_read_query(RELATIONSHIPS_QUERY)).data()
+                
+                graph = nx.Graph()
+                for edge in edges:
+                    source, target = edge["source_id"], edge["target_id"]
+                    if graph.has_edge(source, target):
+                        graph[source][target]["weight"] += 1
+                    else:
+                        graph.add_edge(source, target, weight=1)
+                
+                communities = [
+                    community
+                    for community in nx.community.louvain_communities(graph, weight="weight", seed=42)
+                    if len(community) >= min_community_size
+                ]
+                
+                llm = get_default_llm()
+                rows = []
+                for index, members in enumerate(communities):
+                    lines = []
+                    for edge in edges:
+                        if edge["source_id"] in members and edge["target_id"] in members:
+                            line = f"- {edge['source_name']} {edge['type']} {edge['target_name']}"
+                            if edge.get("description"):
+                                line += f" ({edge['description']})"
+                            lines.append(line)
                     
-                    for record in result:
-                        entity_info = {
-                            "entity": record["entity_name"],
-                            "type": record["entity_type"],
-                            "relationships": record["relationships"]
-                        }
-                        results.append(entity_info)
-            
-            # Deduplicate
-            seen = set()
-            unique_results = []
-            for r in results:
-                key = (r["entity"], r["type"])
-                if key not in seen:
-                    seen.add(key)
-                    unique_results.append(r)
-            
-            return unique_results[:limit]
+                    summary = llm.generate_response(
+                        COMMUNITY_SUMMARY_PROMPT.format(relationships="\n".join(lines)),
+                        "You write concise, factual summaries of knowledge graph communities."
+                    )
+                    rows.append({
+                        "id": f"community:{index}",
+                        "summary": summary.strip(),
+                        "members": sorted(members)
+                    })
+                
+                def replace_communities(tx: ManagedTransaction) -> None:
+                    tx.run("MATCH (c:Community) DETACH DELETE c").consume()
+                    _run_unwind_batches(tx, [(WRITE_COMMUNITIES_QUERY, rows)])
+                
+                # Replace the old communities in one transaction
+                with self.session() as session:
+                    session.execute_write(replace_communities)
+                
+                self._set_has_communities(bool(rows))
+                self._context_cache.clear()
+                logger.info("Built %d community summaries", len(rows))
+                return len(rows)
+                
+            except Exception as e:
+                logger.error("Error building community summaries: %s", e)
+                raise GraphError(f"Failed to build community summaries: {e}")
+    
+    def schedule_community_summaries(self) -> None:
+        """
+        Rebuild community summaries on a background thread.
+        
+        Requests made while a rebuild is running are coalesced into a single
+        follow-up rebuild, which sees every write made before it starts. The
+        worker is a daemon thread, so it does not hold up interpreter exit;
+        an interrupted rebuild leaves the previous communities in place.
+        """
+        if not self.driver:
+            return
+        
+        with self._rebuild_lock:
+            if self._rebuild_pending:
+                return
+            self._rebuild_pending = True
+            if self._rebuild_thread is not None:
+                return  # The running worker picks the request up when it finishes
+            self._rebuild_thread = threading.Thread(
+                target=self._run_community_rebuilds,
+                name="ragforge-community-summaries",
+                daemon=True
+            )
+            self._rebuild_thread.start()
+    
+    def _run_community_rebuilds(self) -> None:
+        """Worker for schedule_community_summaries(); rebuilds until no request is pending."""
+        while True:
+            with self._rebuild_lock:
+                if not self._rebuild_pending or not self.driver:
+                    self._rebuild_pending = False
+                    self._rebuild_thread = None
+                    return
+                self._rebuild_pending = False
+            try:
+                self.build_community_summaries()
+            except (GraphError, ConfigurationError) as e:
+                logger.warning("Community summaries were not built: %s", e)
+    
+    def _set_has_communities(self, found: bool) -> None:
+        """Records whether Community nodes exist, valid for COMMUNITY_CHECK_TTL seconds."""
+        self._has_communities = found
+        self._communities_checked = time.monotonic()
+    
+    def query_community_summaries(self, query_text: str, limit: int = 3) -> List[str]:
+        """
+        Find community summaries relevant to the query using the full-text index.
+        
+        Args:
+            query_text: The query text.
+            limit: Maximum number of summaries to return.
             
+        Returns:
+            The summaries scoring at least ``settings.community_min_score`` and
+            COMMUNITY_SCORE_RATIO of the best match, best match first. Empty if
+            community summaries are disabled or none were built.
+        """
+        if not self.driver or not settings.enable_community_summaries:
+            return []
+        
+        # Plain words only, so the question cannot inject Lucene query syntax
+        terms = " ".join(re.findall(r"\w+", query_text))
+        if not terms:
+            return []
+        
+        try:
+            with self.session() as session:
+                if (self._communities_checked is None
+                        or time.monotonic() - self._communities_checked > COMMUNITY_CHECK_TTL):
+                    record = session.run("MATCH (c:Community) RETURN count(c) > 0 AS found").single()
+                    self._set_has_communities(bool(record and record["found"]))
+                if not self._has_communities:
+                    return []
+                
+                records = session.run(_read_query(COMMUNITY_SUMMARIES_QUERY), {
+                    "terms": terms,
+                    "limit": limit,
+                    "min_score": settings.community_min_score
+                }).data()
         except Exception as e:
-            logger.error(f"Error querying graph: {e}")
+            logger.error("Error querying community summaries: %s", e)
+            return []
+        
+        if not records:
             return []
+        cutoff = records[0]["score"] * COMMUNITY_SCORE_RATIO
+        return [record["summary"] for record in records if record["score"] >= cutoff]
     
     def get_graph_context(self, query_text: str, max_entities: int = 5) -> str:
         """
         Get graph-based context for a query by finding related entities and their connections.
         
+        If community summaries are enabled and built, and one matches the
+        query well enough (see query_community_summaries()), they are returned
+        instead of traversing the graph. With the entity prefilter
+        enabled, questions in which spaCy finds no named entity skip the
+        traversal.
+        
         Args:
             query_text: The query text.
             max_entities: Maximum number of entities to include.
@@ -336,6 +944,30 @@ Return only valid JSON. Do not include any explanations or markdown formatting."
         if not self.driver:
             return ""
         
+        # Repeated questions skip the LLM extraction and traversal until the
+        # graph changes (or the entry expires, for writes by other processes)
+        cache_key = ResponseCache.make_key(query_text, str(max_entities))
+        context = self._context_cache.get(cache_key)
+        if context is None:
+            context = self._build_graph_context(query_text, max_entities)
+            # An empty context may come from a transient Neo4j or LLM error,
+            # so only real results are cached
+            if context:
+                self._context_cache.set(cache_key, context)
+        return context
+    
+    def _build_graph_context(self, query_text: str, max_entities: int) -> str:
+        """Builds the graph context for get_graph_context() without caching."""
+        # Precomputed community summaries answer global questions without a
+        # live entity extraction and traversal
+        summaries = self.query_community_summaries(query_text)
+        if summaries:
+            return "\n".join(["Graph Context (community summaries):"] + [f"- {summary}" for summary in summaries])
+        
+        # Questions naming nothing specific gain nothing from a graph traversal
+        if settings.entity_prefilter and not find_named_entities(query_text):
+            return ""
+        
         related_entities = self.query_related_entities(query_text, limit=max_entities)
         
         if not related_entities:
@@ -371,15 +1003,21 @@ Return only valid JSON. Do not include any explanations or markdown formatting."
             return
         
         try:
-            with self.driver.session(database=settings.neo4j_database) as session:
-                session.run("MATCH (n) DETACH DELETE n")
+            with self.session() as session:
+                # IN TRANSACTIONS needs an auto-commit transaction, so use run()
+                session.run(CLEAR_GRAPH_QUERY).consume()
+                self._set_has_communities(False)
+                self._context_cache.clear()
                 logger.info("Graph cleared")
         except Exception as e:
-            logger.error(f"Error clearing graph: {e}")
+            logger.error("Error clearing graph: %s", e)
             raise GraphError(f"Failed to clear graph: {e}")
     
     def close(self):
-        """Close the Neo4j driver connection."""
+        """Close the Neo4j driver connection, dropping any queued summary rebuild."""
+        with self._rebuild_lock:
+            self._rebuild_pending = False
         if self.driver:
             self.driver.close()
+            self.driver = None
             logger.info("Neo4j connection closed")
@@ -0,0 +1,65 @@
+import threading
+from functools import lru_cache
+from typing import Any, List, Tuple
+
+from ragforge.errors import ConfigurationError
+
+SPACY_MODEL = "en_core_web_sm"
+
+# spaCy labels for named things worth putting in the graph (dates, amounts
+# and other numeric labels are left to the LLM)
+NAMED_ENTITY_LABELS = frozenset({
+    "PERSON", "NORP", "FAC", "ORG", "GPE", "LOC",
+    "PRODUCT", "EVENT", "WORK_OF_ART", "LAW", "LANGUAGE",
+})
+
+_nlp_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_nlp() -> Any:
+    """
+    Loads the spaCy pipeline once, with the components NER does not need disabled.
+
+    Raises:
+        ConfigurationError: If spaCy or its English model is not installed.
+    """
+    try:
+        import spacy
+    except ImportError:
+        raise ConfigurationError(
+            "The entity prefilter requires the 'spacy' package. "
+            "Install it with: pip install ragforge[ner]"
+        )
+    try:
+        return spacy.load(SPACY_MODEL, disable=["parser", "lemmatizer"])
+    except OSError:
+        raise ConfigurationError(
+            f"The spaCy model '{SPACY_MODEL}' is not installed. "
+            f"Install it with: python -m spacy download {SPACY_MODEL}"
+        )
+
+
+def find_named_entities(text: str) -> List[Tuple[str, str]]:
+    """
+    Finds named entities in text with spaCy, without calling the LLM.
+
+    Args:
+        text: The text to scan.
+
+    Returns:
+        Unique (name, label) pairs in order of first appearance.
+
+    Raises:
+        ConfigurationError: If spaCy or its English model is not installed.
+    """
+    nlp = _get_nlp()
+    # spaCy does not document its pipelines as thread-safe, and a call takes
+    # about a millisecond, so serialize calls from the extraction pool
+    with _nlp_lock:
+        doc = nlp(text)
+    found = {}
+    for ent in doc.ents:
+        if ent.label_ in NAMED_ENTITY_LABELS:
+            found.setdefault(ent.text.strip(), ent.label_)
+    return list(found.items())
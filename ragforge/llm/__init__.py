@@ -1,17 +1,34 @@
-from ragforge.llm.groq import GroqLLM
+import threading
+from typing import Any
+
 from ragforge.llm.base import BaseLLM
 
 _llm_instance = None
+_lock = threading.Lock()
 
 def get_default_llm() -> BaseLLM:
     """
     Returns the singleton instance of the default LLM provider (Groq).
     Reuses the same instance across calls to avoid creating multiple connections.
+    The Groq SDK is only imported on the first call.
     
     Returns:
         BaseLLM: The singleton LLM instance.
     """
     global _llm_instance
-    if _llm_instance is None:
-        _llm_instance = GroqLLM()
+    # Fast path: once created, the instance is returned without locking
+    llm = _llm_instance
+    if llm is not None:
+        return llm
+    with _lock:
+        if _llm_instance is None:
+            from ragforge.llm.groq import GroqLLM
+            _llm_instance = GroqLLM()
     return _llm_instance
+
+def __getattr__(name: str) -> Any:
+    if name == "GroqLLM":
+        from ragforge.llm.groq import GroqLLM
+        return GroqLLM
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
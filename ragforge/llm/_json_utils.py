@@ -0,0 +1,53 @@
+import json
+import re
+from typing import Any
+
+try:
+    # Optional: orjson parses LLM payloads several times faster. Its decode
+    # error subclasses json.JSONDecodeError, so callers handle both alike
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# A whole response wrapped in a markdown code fence, optionally tagged ``json``
+_CODE_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.S)
+
+
+def strip_code_fence(text: str) -> str:
+    """
+    Removes a markdown code fence the LLM may wrap around its JSON output.
+
+    Args:
+        text: The raw LLM response.
+
+    Returns:
+        The response without the surrounding fence.
+    """
+    match = _CODE_FENCE_RE.match(text)
+    if match:
+        return match.group(1)
+    # Unterminated fence, e.g. a response cut off at the token limit
+    return text.strip().removeprefix("```json").removeprefix("```").strip()
+
+
+def parse_llm_json(raw: str) -> Any:
+    """
+    Parses a JSON LLM response, tolerating a surrounding markdown code fence.
+
+    Args:
+        raw: The raw LLM response.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON.
+    """
+    try:
+        # Most responses are bare JSON, so skip the regex for them
+        return _loads(raw)
+    except json.JSONDecodeError:
+        stripped = strip_code_fence(raw)
+        if stripped == raw:
+            raise
+        return _loads(stripped)
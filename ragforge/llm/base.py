@@ -11,13 +11,15 @@ class BaseLLM(ABC):
     """
 
     @abstractmethod
-    def generate_response(self, prompt: str, system_prompt: str) -> str:
+    def generate_response(self, prompt: str, system_prompt: str, json_mode: bool = False) -> str:
         """
         Generates a response from the LLM.
         
         Args:
             prompt: The user query + context.
             system_prompt: Instructions for the LLM behavior.
+            json_mode: Ask the provider to constrain the output to a valid JSON
+                object. Providers without such a mode may ignore it.
             
         Returns:
             The raw string response from the LLM.
@@ -1,7 +1,12 @@
+import atexit
+import importlib.util
+import random
+import threading
 import time
 import logging
 from typing import Optional
 import groq
+import httpx
 from groq import Groq
 
 from ragforge.llm.base import BaseLLM
@@ -10,6 +15,78 @@ from ragforge.errors import ProviderError, ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Backoff bounds in seconds when the server gives no Retry-After hint
+RETRY_BASE_DELAY = 0.25
+MAX_BACKOFF_DELAY = 8.0
+
+# Upper bound in seconds for a server-requested retry delay
+MAX_RETRY_DELAY = 60.0
+
+# Client errors that may succeed when retried; any other 4xx is final
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+# Groq errors considered for a retry; _is_retryable() makes the final call
+GROQ_API_ERRORS = (groq.APIConnectionError, groq.RateLimitError, groq.APIStatusError)
+
+_http_client: Optional[httpx.Client] = None
+_http_lock = threading.Lock()
+
+def _get_http_client() -> httpx.Client:
+    """
+    Returns the process-wide HTTP client used for Groq API calls.
+    
+    Sharing one keep-alive connection pool avoids a new TCP/TLS handshake
+    for every request and for every GroqLLM instance.
+    
+    Returns:
+        httpx.Client: The shared HTTP client.
+    """
+    global _http_client
+    with _http_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                timeout=settings.llm_timeout,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60
+                ),
+                # Multiplex concurrent calls over one connection when h2 is installed
+                http2=importlib.util.find_spec("h2") is not None
+            )
+            atexit.register(_http_client.close)
+    return _http_client
+
+def _is_retryable(error: Exception) -> bool:
+    """Connection errors, timeouts, rate limits and 5xx responses are worth retrying."""
+    if isinstance(error, groq.APIStatusError):
+        return error.status_code >= 500 or error.status_code in RETRYABLE_STATUS_CODES
+    return True
+
+def _retry_delay(error: Exception, previous: float) -> float:
+    """
+    Returns how long to wait before retrying a failed call.
+    
+    Honors the server's Retry-After header, otherwise backs off with
+    decorrelated jitter: each delay is drawn between the base delay and three
+    times the previous one, so the first retry is quick and concurrent callers
+    do not retry in lockstep.
+    
+    Args:
+        error: The error raised by the failed call.
+        previous: The previous delay, or RETRY_BASE_DELAY before the first retry.
+        
+    Returns:
+        The delay in seconds.
+    """
+    response = getattr(error, "response", None)
+    if response is not None:
+        try:
+            return min(MAX_RETRY_DELAY, float(response.headers.get("retry-after")))
+        except (TypeError, ValueError):
+            pass
+    return min(MAX_BACKOFF_DELAY, random.uniform(RETRY_BASE_DELAY, previous * 3))
+
 class GroqLLM(BaseLLM):
     """
     Groq implementation of the LLM provider.
@@ -24,32 +101,42 @@ class GroqLLM(BaseLLM):
             )
         
         try:
-            self.client = Groq(api_key=settings.groq_api_key)
+            self.client = Groq(
+                api_key=settings.groq_api_key,
+                http_client=_get_http_client(),
+                max_retries=0 # Retries are handled by generate_response
+            )
         except Exception as e:
             raise ProviderError(f"Failed to initialize Groq client: {str(e)}")
 
-    def generate_response(self, prompt: str, system_prompt: str) -> str:
+        # Settings are immutable, so read them once rather than on every call
+        self._model = settings.llm_model
+        self._max_retries = settings.llm_max_retries
+
+    def generate_response(self, prompt: str, system_prompt: str, json_mode: bool = False) -> str:
         """
         Generates a response using Groq API with retries.
+        
+        With ``json_mode`` the request uses Groq's JSON object response
+        format, so the output is valid JSON without markdown fences.
         """
         retries = 0
+        delay = RETRY_BASE_DELAY
         last_error = None
+        options = {"response_format": {"type": "json_object"}} if json_mode else {}
+
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
 
-        while retries < settings.llm_max_retries:
+        while retries < self._max_retries:
             try:
                 chat_completion = self.client.chat.completions.create(
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": system_prompt,
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt,
-                        }
-                    ],
-                    model=settings.llm_model,
+                    messages=messages,
+                    model=self._model,
                     temperature=0.1, # Low temperature for factual grounding
+                    **options
                 )
                 
                 content = chat_completion.choices[0].message.content
@@ -58,11 +145,15 @@ class GroqLLM(BaseLLM):
                     
                 return content
 
-            except (groq.APIConnectionError, groq.RateLimitError, groq.APIStatusError) as e:
-                logger.warning(f"Groq API error (attempt {retries + 1}): {e}")
+            except GROQ_API_ERRORS as e:
+                if not _is_retryable(e):
+                    raise ProviderError(f"Groq API rejected the request: {str(e)}")
+                logger.warning("Groq API error (attempt %d): %s", retries + 1, e)
                 last_error = e
                 retries += 1
-                time.sleep(1 * retries) # Exponential backoff-ish
+                if retries < self._max_retries:
+                    delay = _retry_delay(e, delay)
+                    time.sleep(delay)
             except Exception as e:
                 # Non-retryable error
                 raise ProviderError(f"Unexpected error during Groq generation: {str(e)}")
@@ -1,13 +1,21 @@
+import asyncio
+import itertools
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 
+from ragforge.cache import ResponseCache, get_response_cache
 from ragforge.llm import get_default_llm
+from ragforge.llm._json_utils import parse_llm_json
 from ragforge.vector import get_vector_store
 from ragforge.settings import settings
 from ragforge.errors import RagforgeError
 from ragforge.graph import get_graph_store
 
+if TYPE_CHECKING:
+    from ragforge.graph.neo4j_store import GraphStore
+
 logger = logging.getLogger(__name__)
 
 SYSTEM_PROMPT = """You are a precise and helpful assistant.
@@ -26,6 +34,128 @@ Example format:
 }
 """
 
+NO_CONTEXT_ANSWER = "I could not find any relevant information in the knowledge base to answer your question."
+
+BATCH_SYSTEM_PROMPT = """You are a precise and helpful assistant.
+You will receive several numbered questions, each with its own context facts.
+Answer each question ONLY using the context facts given for that question.
+Do not use outside knowledge.
+If the facts do not contain the answer, state that you cannot answer based on the available information.
+
+Your output must be a valid JSON object with exactly one key, "answers": a list with one
+object per question, in the same order, each with exactly three keys:
+1. "question": The number of the question (integer).
+2. "facts": A list of strings, where each string is a specific fact from that question's context used to answer it.
+3. "answer": A string containing the final answer.
+
+Example format:
+{
+  "answers": [
+    {"question": 1, "facts": ["GraphRAG is a method..."], "answer": "GraphRAG is a method..."},
+    {"question": 2, "facts": [], "answer": "I cannot answer based on the available information."}
+  ]
+}
+"""
+
+def _resolve_graph_store(use_graphrag: Optional[bool]) -> Optional["GraphStore"]:
+    """
+    Resolves the GraphRAG override to the graph store to use.
+    
+    Args:
+        use_graphrag: Override GraphRAG (None = auto-detect, True = force enable, False = disable).
+        
+    Returns:
+        The connected GraphStore, or None for standard RAG.
+    """
+    if use_graphrag is False:
+        return None
+    # Auto-detected or forced, GraphRAG needs Neo4j to be actually connected
+    graph_store = get_graph_store()
+    return graph_store if graph_store.driver is not None else None
+
+def _get_graph_context(graph_store: "GraphStore", question: str) -> str:
+    """Returns graph context for a question, or an empty string if graph retrieval fails."""
+    try:
+        return graph_store.get_graph_context(question, max_entities=5)
+    except Exception:
+        # Silently fallback - no error logging
+        return ""
+
+def _build_context(question: str, graph_store: Optional["GraphStore"]) -> str:
+    """
+    Retrieves vector (and optionally graph) context for a question.
+    
+    Args:
+        question: The user's question.
+        graph_store: The graph store to add graph context from, or None.
+        
+    Returns:
+        The formatted context, or an empty string if nothing relevant was found.
+    """
+    store = get_vector_store()
+    # Before anything is ingested, skip embedding the question for a search
+    # that cannot return results
+    search_vectors = not store.is_empty()
+    
+    if graph_store is not None:
+        # Graph retrieval includes an LLM call for the query entities, so run
+        # it on a worker thread while this thread does the vector search
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            graph_future = pool.submit(_get_graph_context, graph_store, question)
+            # 1. Vector Retrieval
+            retrieved_docs = store.search(question, limit=settings.max_context_chunks) if search_vectors else []
+            # 2. Graph Retrieval
+            graph_context = graph_future.result()
+    else:
+        if not search_vectors:
+            return ""
+        retrieved_docs = store.search(question, limit=settings.max_context_chunks)
+        graph_context = ""
+    
+    # 3. Context Construction
+    return _format_context(retrieved_docs, graph_context)
+
+def _format_context(retrieved_docs: List[str], graph_context: str) -> str:
+    """Formats retrieved chunks and graph context into the prompt context."""
+    # Joined in one pass, without intermediate lists
+    return "\n".join(itertools.chain(
+        ("Vector Search Results:",) if retrieved_docs else (),
+        (f"- {doc}" for doc in retrieved_docs),
+        ("", graph_context) if graph_context else ()
+    ))
+
+def _build_contexts(questions: List[str], graph_store: Optional["GraphStore"]) -> List[str]:
+    """
+    Retrieves context for several questions, like _build_context().
+    
+    All vector searches go out as one batch: the questions are embedded
+    together and Qdrant is queried in a single round trip. Graph retrieval
+    runs per question on worker threads meanwhile.
+    
+    Args:
+        questions: The user's questions.
+        graph_store: The graph store to add graph context from, or None.
+        
+    Returns:
+        One formatted context per question, in the same order as ``questions``.
+    """
+    store = get_vector_store()
+    # As in _build_context(), skip embedding while nothing is ingested
+    search_vectors = not store.is_empty()
+    
+    doc_lists: List[List[str]] = [[] for _ in questions]
+    graph_contexts = [""] * len(questions)
+    if graph_store is not None:
+        with ThreadPoolExecutor(max_workers=min(8, len(questions))) as executor:
+            graph_futures = [executor.submit(_get_graph_context, graph_store, q) for q in questions]
+            if search_vectors:
+                doc_lists = store.search_batch(questions, limit=settings.max_context_chunks)
+            graph_contexts = [future.result() for future in graph_futures]
+    elif search_vectors:
+        doc_lists = store.search_batch(questions, limit=settings.max_context_chunks)
+    
+    return [_format_context(docs, graph_context) for docs, graph_context in zip(doc_lists, graph_contexts)]
+
 def ask(question: str, use_graphrag: Optional[bool] = None) -> Dict[str, Any]:
     """
     The main entry point for the RAG/GraphRAG pipeline.
@@ -41,49 +171,17 @@ def ask(question: str, use_graphrag: Optional[bool] = None) -> Dict[str, Any]:
         A dictionary containing "facts" (list) and "answer" (str).
     """
     try:
-        # Auto-detect: use GraphRAG if explicitly enabled OR if Neo4j is available
-        if use_graphrag is None:
-            # Auto-detect: check if GraphRAG is available
-            graph_store = get_graph_store()
-            use_graph = (graph_store.driver is not None)
-        else:
-            use_graph = use_graphrag
-        
-        # 1. Vector Retrieval
-        store = get_vector_store()
-        retrieved_docs = store.search(question, limit=settings.max_context_chunks)
+        graph_store = _resolve_graph_store(use_graphrag)
         
-        # 2. Graph Retrieval (if available)
-        graph_context = ""
-        if use_graph:
-            try:
-                graph_store = get_graph_store()
-                # Only try graph retrieval if Neo4j is actually connected
-                if graph_store.driver is not None:
-                    graph_context = graph_store.get_graph_context(question, max_entities=5)
-            except Exception:
-                # Silently fallback - no error logging
-                pass
-        
-        # 3. Context Construction
-        context_parts = []
-        
-        if retrieved_docs:
-            context_parts.append("Vector Search Results:")
-            context_parts.extend([f"- {doc}" for doc in retrieved_docs])
-        
-        if graph_context:
-            context_parts.append("")
-            context_parts.append(graph_context)
-        
-        if not context_parts:
+        # 1-3. Retrieval and Context Construction
+        context_str = _build_context(question, graph_store)
+        
+        if not context_str:
             return {
                 "facts": [],
-                "answer": "I could not find any relevant information in the knowledge base to answer your question."
+                "answer": NO_CONTEXT_ANSWER
             }
         
-        context_str = "\n".join(context_parts)
-        
         # 4. Grounded Prompt
         full_prompt = f"""Context:
 {context_str}
@@ -93,31 +191,37 @@ Question:
 
 Answer (in JSON):"""
 
-        # 5. LLM Answer
-        llm = get_default_llm()
-        raw_response = llm.generate_response(full_prompt, SYSTEM_PROMPT)
+        # 5. LLM Answer (repeated questions over the same context hit the cache)
+        response_cache = get_response_cache()
+        cache_key = None
+        raw_response = None
+        if response_cache is not None:
+            cache_key = ResponseCache.make_key(
+                settings.llm_model, question.strip().lower(), context_str
+            )
+            raw_response = response_cache.get(cache_key)
+        
+        if raw_response is None:
+            llm = get_default_llm()
+            raw_response = llm.generate_response(full_prompt, SYSTEM_PROMPT, json_mode=True)
         
         # 6. Parse Response
         try:
-            # Clean up potential markdown code blocks if the LLM adds them
-            cleaned_response = raw_response.strip()
-            if cleaned_response.startswith("```json"):
-                cleaned_response = cleaned_response[7:]
-            if cleaned_response.startswith("```"):
-                cleaned_response = cleaned_response[3:]
-            if cleaned_response.endswith("```"):
-                cleaned_response = cleaned_response[:-3]
-            
-            parsed_response = json.loads(cleaned_response)
+            # JSON mode returns bare JSON; fences are still tolerated for other providers
+            parsed_response = parse_llm_json(raw_response)
             
             # Validate structure
             if "facts" not in parsed_response or "answer" not in parsed_response:
                 raise ValueError("Missing required keys in JSON response")
+            
+            # Only well-formed answers are worth replaying
+            if cache_key is not None:
+                response_cache.set(cache_key, raw_response)
                 
             return parsed_response
             
         except json.JSONDecodeError:
-            logger.error(f"Failed to parse LLM response: {raw_response}")
+            logger.error("Failed to parse LLM response: %s", raw_response)
             # Fallback if JSON parsing fails but we have a response
             return {
                 "facts": [],
@@ -125,7 +229,7 @@ Answer (in JSON):"""
             }
 
     except RagforgeError as e:
-        logger.error(f"Ragforge error: {e}")
+        logger.error("Ragforge error: %s", e)
         return {
             "facts": [],
             "answer": f"An error occurred while processing your request: {str(e)}"
@@ -137,7 +241,148 @@ Answer (in JSON):"""
             "answer": "An unexpected system error occurred."
         }
 
-def ingest(texts: List[str], use_graphrag: Optional[bool] = None) -> None:
+async def aask(question: str, use_graphrag: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Async variant of ask().
+    
+    The pipeline runs in a worker thread so that several questions can wait on
+    Qdrant, Neo4j and the LLM at the same time without blocking the event loop.
+    
+    Args:
+        question: The user's question.
+        use_graphrag: Override GraphRAG (None = auto-detect, True = force enable, False = disable).
+        
+    Returns:
+        A dictionary containing "facts" (list) and "answer" (str).
+    """
+    return await asyncio.to_thread(ask, question, use_graphrag)
+
+async def aask_many(
+    questions: List[str],
+    use_graphrag: Optional[bool] = None,
+    concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Answers several independent questions concurrently.
+    
+    Args:
+        questions: The questions to answer.
+        use_graphrag: Override GraphRAG (None = auto-detect, True = force enable, False = disable).
+        concurrency: Maximum number of questions in flight, to respect provider rate limits.
+        
+    Returns:
+        One result dictionary per question, in the same order as ``questions``.
+        
+    Example:
+        >>> results = asyncio.run(aask_many(["What is RAG?", "What is GraphRAG?"]))
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _bounded(question: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await aask(question, use_graphrag)
+    
+    return list(await asyncio.gather(*(_bounded(q) for q in questions)))
+
+def ask_batch(questions: List[str], use_graphrag: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """
+    Answers several questions with a single LLM call.
+    
+    Context is retrieved for all questions together, then all questions
+    that have context are sent in one structured prompt, so N questions cost
+    one LLM round trip instead of N. Questions the batched response does not
+    answer are retried individually with ask().
+    
+    Args:
+        questions: The questions to answer.
+        use_graphrag: Override GraphRAG (None = auto-detect, True = force enable, False = disable).
+        
+    Returns:
+        One result dictionary per question, in the same order as ``questions``.
+        
+    Example:
+        >>> results = ask_batch(["What is RAG?", "What is GraphRAG?"])
+    """
+    if not questions:
+        return []
+    
+    try:
+        graph_store = _resolve_graph_store(use_graphrag)
+        contexts = _build_contexts(questions, graph_store)
+    except Exception as e:
+        logger.warning("Batched retrieval failed, answering questions individually: %s", e)
+        return [ask(question, use_graphrag) for question in questions]
+    
+    results: List[Optional[Dict[str, Any]]] = [None] * len(questions)
+    prompt_parts = []
+    for number, (question, context_str) in enumerate(zip(questions, contexts), start=1):
+        if not context_str:
+            results[number - 1] = {"facts": [], "answer": NO_CONTEXT_ANSWER}
+            continue
+        prompt_parts.append(f"Context for question {number}:\n{context_str}\n\nQuestion {number}:\n{question}")
+    
+    if prompt_parts:
+        full_prompt = "\n\n".join(prompt_parts) + "\n\nAnswers (in JSON):"
+        try:
+            llm = get_default_llm()
+            raw_response = llm.generate_response(full_prompt, BATCH_SYSTEM_PROMPT, json_mode=True)
+            parsed_response = parse_llm_json(raw_response)
+            
+            for item in parsed_response.get("answers", []):
+                index = int(item.get("question", 0)) - 1
+                if 0 <= index < len(questions) and results[index] is None and "answer" in item:
+                    results[index] = {"facts": item.get("facts", []), "answer": item["answer"]}
+        except (RagforgeError, ValueError, TypeError, AttributeError) as e:
+            logger.warning("Batched answer failed, answering questions individually: %s", e)
+    
+    return [
+        result if result is not None else ask(question, use_graphrag)
+        for question, result in zip(questions, results)
+    ]
+
+def _build_graph(graph_store: "GraphStore", texts: List[str]) -> None:
+    """
+    Extracts entities and relationships from texts not yet in the graph into Neo4j.
+    
+    Failures are logged rather than raised. A document whose extraction or
+    write failed is not recorded in the graph, so ingesting it again retries it.
+    """
+    try:
+        new_texts = graph_store.filter_new_texts(texts)
+        if not new_texts:
+            logger.debug("All texts are already in the knowledge graph")
+            return
+        
+        logger.debug("Building knowledge graph for %d documents...", len(new_texts))
+        
+        def add_document(text: str) -> None:
+            try:
+                graph_store.add_document_to_graph(text, flush=False)
+            except RagforgeError as e:
+                logger.warning("Skipping a document in the knowledge graph: %s", e)
+        
+        # Extraction is dominated by LLM latency, so overlap the calls;
+        # extracted rows are only buffered until the flush below
+        documents = [text for text in new_texts if text.strip()]
+        if documents:
+            workers = min(settings.entity_extraction_concurrency, len(documents))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(add_document, documents))
+        
+        # Write all extracted entities and relationships serially in batched queries
+        graph_store.flush()
+        
+        if settings.enable_community_summaries:
+            # Summaries speed up later ask() calls but are not needed to
+            # finish ingestion, so build them off the caller's thread
+            graph_store.schedule_community_summaries()
+        
+        logger.debug("Knowledge graph construction complete")
+    except Exception as e:
+        # Vector ingestion still succeeds; the graph is retried on the next ingest
+        logger.error("Knowledge graph construction failed: %s", e)
+
+def ingest(texts: List[str], use_graphrag: Optional[bool] = None) -> int:
     """
     Add documents to the knowledge base for retrieval.
     
@@ -145,13 +390,25 @@ def ingest(texts: List[str], use_graphrag: Optional[bool] = None) -> None:
     1. Embeds texts and stores them in the vector database (Qdrant) - always
     2. Extracts entities and relationships and builds a knowledge graph (Neo4j) - if available
     
+    Both steps run concurrently.
+    
+    Texts that are duplicated in ``texts`` or already stored are skipped
+    by each store separately: texts already in Qdrant are not embedded
+    again, and texts already in the graph are not extracted again. A text
+    ingested before without GraphRAG, or whose graph build failed, still
+    reaches the graph when ingested again.
+    
     Automatically uses GraphRAG if Neo4j is configured and available,
-    otherwise uses standard RAG. No errors or warnings are shown.
+    otherwise uses standard RAG. Graph construction failures are logged,
+    not raised.
     
     Args:
         texts: List of string documents to add to the knowledge base.
         use_graphrag: Override GraphRAG (None = auto-detect, True = force enable, False = disable).
         
+    Returns:
+        The number of texts newly added to the vector store.
+        
     Raises:
         IngestionError: If document ingestion fails.
         
@@ -161,31 +418,17 @@ def ingest(texts: List[str], use_graphrag: Optional[bool] = None) -> None:
         ...     "RAG stands for Retrieval Augmented Generation."
         ... ])
     """
-    # Auto-detect: use GraphRAG if explicitly enabled OR if Neo4j is available
-    if use_graphrag is None:
-        # Auto-detect: check if GraphRAG is available
-        graph_store = get_graph_store()
-        use_graph = (graph_store.driver is not None)
-    else:
-        use_graph = use_graphrag
+    graph_store = _resolve_graph_store(use_graphrag)
     
-    # 1. Vector Store Ingestion (always)
+    # Each store skips the texts it already holds
     store = get_vector_store()
-    store.add_texts(texts)
+    if graph_store is None:
+        return len(store.add_texts(texts))
     
-    # 2. Graph Construction (if available)
-    if use_graph:
-        try:
-            graph_store = get_graph_store()
-            # Check if GraphStore actually has a connection (Neo4j might be unavailable)
-            if graph_store.driver is not None:
-                logger.debug(f"Building knowledge graph for {len(texts)} documents...")
-                
-                for i, text in enumerate(texts):
-                    if text.strip():  # Skip empty texts
-                        graph_store.add_document_to_graph(text, doc_id=f"doc_{i}")
-                
-                logger.debug("Knowledge graph construction complete")
-        except Exception:
-            # Silently fallback - no error logging
-            pass
\ No newline at end of file
+    # Embedding (CPU) and graph extraction (LLM latency) are independent, so
+    # build the graph on a worker thread while this thread embeds
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        graph_future = pool.submit(_build_graph, graph_store, texts)
+        added = store.add_texts(texts)
+        graph_future.result()
+    return len(added)
@@ -1,6 +1,6 @@
-import os
-from typing import Optional, Dict
-from pydantic import Field, model_validator
+from functools import cached_property, lru_cache
+from typing import Literal, Optional, Dict
+from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Embedding model dimensions mapping
@@ -8,6 +8,9 @@ EMBEDDING_DIMENSIONS: Dict[str, int] = {
     "sentence-transformers/all-MiniLM-L6-v2": 384,
     "sentence-transformers/all-mpnet-base-v2": 768,
     "sentence-transformers/all-MiniLM-L12-v2": 384,
+    # FastEmbed ships these as int8-quantized ONNX models (faster on CPU)
+    "BAAI/bge-small-en-v1.5": 384,
+    "BAAI/bge-base-en-v1.5": 768,
     # Add more models as needed
 }
 
@@ -38,6 +41,17 @@ class Settings(BaseSettings):
         le=10,
         description="Maximum number of retries for LLM API calls"
     )
+    llm_cache_size: int = Field(
+        1024,
+        validation_alias=AliasChoices("RAGFORGE_LLM_CACHE_SIZE", "LLM_CACHE_SIZE"),
+        ge=0,
+        description="Maximum number of LLM responses cached in memory (0 disables the in-memory cache)"
+    )
+    llm_cache_dir: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices("RAGFORGE_LLM_CACHE_DIR", "LLM_CACHE_DIR"),
+        description="Directory for a persistent LLM response cache (requires the 'cache' extra)"
+    )
 
     # Vector Store Settings
     qdrant_path: str = Field(
@@ -45,6 +59,16 @@ class Settings(BaseSettings):
         env="RAGFORGE_QDRANT_PATH",
         description="Path to local Qdrant storage directory"
     )
+    qdrant_url: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices("QDRANT_URL", "RAGFORGE_QDRANT_URL"),
+        description="URL of a Qdrant server. When set, it is used instead of local storage"
+    )
+    qdrant_grpc_port: int = Field(
+        6334,
+        validation_alias=AliasChoices("RAGFORGE_QDRANT_GRPC_PORT", "QDRANT_GRPC_PORT"),
+        description="gRPC port of the Qdrant server"
+    )
     fastembed_cache_path: str = Field(
         "./.fastembed_cache", 
         env="RAGFORGE_FASTEMBED_CACHE_PATH",
@@ -59,6 +83,35 @@ class Settings(BaseSettings):
         env="RAGFORGE_EMBEDDING_MODEL",
         description="Embedding model identifier. Must be a supported FastEmbed model."
     )
+    embed_batch_size: int = Field(
+        32,
+        validation_alias=AliasChoices("RAGFORGE_EMBED_BATCH", "EMBED_BATCH_SIZE"),
+        ge=1,
+        description="Number of texts embedded per model forward pass during ingestion"
+    )
+    embed_parallel: Optional[int] = Field(
+        None,
+        validation_alias=AliasChoices("RAGFORGE_EMBED_PARALLEL", "EMBED_PARALLEL"),
+        ge=0,
+        description="Embedding worker processes for large ingests (0 = one per core, unset = single process)"
+    )
+    upload_batch_size: int = Field(
+        256,
+        validation_alias=AliasChoices("RAGFORGE_UPLOAD_BATCH", "UPLOAD_BATCH_SIZE"),
+        ge=1,
+        description="Number of points sent to Qdrant per upload request"
+    )
+    upload_parallel: int = Field(
+        1,
+        validation_alias=AliasChoices("RAGFORGE_UPLOAD_PARALLEL", "UPLOAD_PARALLEL"),
+        ge=1,
+        description="Worker processes uploading batches to a Qdrant server concurrently"
+    )
+    vector_quantization: Literal["none", "int8", "binary", "product"] = Field(
+        "int8",
+        validation_alias=AliasChoices("RAGFORGE_QUANTIZATION", "VECTOR_QUANTIZATION"),
+        description="Compressed in-RAM copy of the vectors used for scoring new collections"
+    )
     
     # RAG Settings
     max_context_chunks: int = Field(
@@ -68,57 +121,99 @@ class Settings(BaseSettings):
         le=50,
         description="Maximum number of context chunks to retrieve"
     )
+    query_cache_size: int = Field(
+        10000,
+        validation_alias=AliasChoices("RAGFORGE_QUERY_CACHE_SIZE", "QUERY_CACHE_SIZE"),
+        ge=0,
+        description="Maximum number of cached vector search results for near-duplicate queries (0 disables this cache)"
+    )
+    query_cache_threshold: float = Field(
+        0.95,
+        validation_alias=AliasChoices("RAGFORGE_QUERY_CACHE_THRESHOLD", "QUERY_CACHE_THRESHOLD"),
+        gt=0,
+        le=1,
+        description="Minimum cosine similarity between queries for a search cache hit"
+    )
     enable_graphrag: Optional[bool] = Field(
         None,
         env="RAGFORGE_ENABLE_GRAPHRAG",
         description="Enable GraphRAG functionality (None = auto-detect based on Neo4j availability)"
     )
+    entity_extraction_concurrency: int = Field(
+        8,
+        validation_alias=AliasChoices("RAGFORGE_EXTRACTION_CONCURRENCY", "ENTITY_EXTRACTION_CONCURRENCY"),
+        ge=1,
+        description="Maximum number of concurrent entity extraction LLM calls, across documents and their chunks"
+    )
+    max_extraction_chars: int = Field(
+        6000,
+        validation_alias=AliasChoices("RAGFORGE_MAX_EXTRACTION_CHARS", "MAX_EXTRACTION_CHARS"),
+        ge=500,
+        description="Texts longer than this are split into pieces for entity extraction"
+    )
+    entity_prefilter: bool = Field(
+        False,
+        validation_alias=AliasChoices("RAGFORGE_ENTITY_PREFILTER", "ENTITY_PREFILTER"),
+        description="Skip LLM entity extraction and graph lookups for texts in which spaCy finds no named entities (requires the 'ner' extra)"
+    )
+    enable_community_summaries: bool = Field(
+        False,
+        validation_alias=AliasChoices("RAGFORGE_COMMUNITY_SUMMARIES", "ENABLE_COMMUNITY_SUMMARIES"),
+        description="Rebuild GraphRAG community summaries in the background after each ingest"
+    )
+    community_min_score: float = Field(
+        0.0,
+        validation_alias=AliasChoices("RAGFORGE_COMMUNITY_MIN_SCORE", "COMMUNITY_MIN_SCORE"),
+        ge=0,
+        description="Minimum full-text score for a community summary to be used instead of the graph traversal (depends on the corpus; 0 disables the cutoff)"
+    )
     
     # Neo4j Settings
     # Uses NEO4J_* environment variables (supports both NEO4J_* and RAGFORGE_NEO4J_*)
-    neo4j_uri: Optional[str] = Field(
-        default=None,
+    neo4j_uri: str = Field(
+        default="bolt://localhost:7687",
+        validation_alias=AliasChoices("NEO4J_URI", "RAGFORGE_NEO4J_URI"),
         description="Neo4j database URI"
     )
     neo4j_user: str = Field(
         default="neo4j",
+        validation_alias=AliasChoices("NEO4J_USER", "RAGFORGE_NEO4J_USER"),
         description="Neo4j username"
     )
     neo4j_password: Optional[str] = Field(
         default=None,
+        validation_alias=AliasChoices("NEO4J_PASSWORD", "RAGFORGE_NEO4J_PASSWORD"),
         description="Neo4j password"
     )
     neo4j_database: str = Field(
         default="neo4j",
+        validation_alias=AliasChoices("NEO4J_DATABASE", "RAGFORGE_NEO4J_DATABASE"),
         description="Neo4j database name"
     )
-    
-    @model_validator(mode='before')
-    @classmethod
-    def set_neo4j_from_env(cls, data: dict) -> dict:
-        """Set Neo4j values from environment variables if not provided."""
-        if data is None:
-            data = {}
-        
-        # Check for NEO4J_* first, then RAGFORGE_NEO4J_* as fallback
-        if "neo4j_uri" not in data or data.get("neo4j_uri") is None:
-            data["neo4j_uri"] = os.getenv("NEO4J_URI") or os.getenv("RAGFORGE_NEO4J_URI") or "bolt://localhost:7687"
-        if "neo4j_user" not in data or not data.get("neo4j_user"):
-            data["neo4j_user"] = os.getenv("NEO4J_USER") or os.getenv("RAGFORGE_NEO4J_USER") or "neo4j"
-        if "neo4j_password" not in data or data.get("neo4j_password") is None:
-            data["neo4j_password"] = os.getenv("NEO4J_PASSWORD") or os.getenv("RAGFORGE_NEO4J_PASSWORD")
-        if "neo4j_database" not in data or not data.get("neo4j_database"):
-            data["neo4j_database"] = os.getenv("NEO4J_DATABASE") or os.getenv("RAGFORGE_NEO4J_DATABASE") or "neo4j"
-        
-        return data
+    neo4j_parallel_runtime: bool = Field(
+        False,
+        validation_alias=AliasChoices("RAGFORGE_NEO4J_PARALLEL_RUNTIME", "NEO4J_PARALLEL_RUNTIME"),
+        description="Run graph read queries on Neo4j's parallel runtime (Enterprise 5.13+)"
+    )
+    neo4j_pool_size: int = Field(
+        50,
+        validation_alias=AliasChoices("RAGFORGE_NEO4J_POOL_SIZE", "NEO4J_POOL_SIZE"),
+        ge=1,
+        description="Maximum number of pooled Neo4j connections"
+    )
     
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        # Fields with env aliases can still be passed by name, e.g. Settings(neo4j_uri=...)
+        populate_by_name=True,
+        ignored_types=(cached_property,),
+        # Settings are read once at startup and immutable afterwards
+        frozen=True,
     )
     
-    @property
+    @cached_property
     def embedding_dimension(self) -> int:
         """
         Returns the embedding dimension for the configured model.
@@ -137,8 +232,16 @@ class Settings(BaseSettings):
         pass
 
 
-# Create global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the process-wide settings, reading the environment only once.
+    
+    Returns:
+        Settings: The shared settings instance.
+    """
+    return Settings()
 
-# Set the environment variable for FastEmbed to ensure it uses the configured cache path
-os.environ["FASTEMBED_CACHE_PATH"] = settings.fastembed_cache_path
+
+# Create global settings instance
+settings = get_settings()
@@ -1,6 +1,8 @@
+import threading
 from ragforge.vector.qdrant import VectorStore
 
 _store_instance = None
+_lock = threading.Lock()
 
 def get_vector_store() -> VectorStore:
     """
@@ -16,6 +18,11 @@ def get_vector_store() -> VectorStore:
         RetrievalError: If vector store initialization fails.
     """
     global _store_instance
-    if _store_instance is None:
-        _store_instance = VectorStore()
+    # Fast path: once created, the instance is returned without locking
+    store = _store_instance
+    if store is not None:
+        return store
+    with _lock:
+        if _store_instance is None:
+            _store_instance = VectorStore()
     return _store_instance
@@ -1,26 +1,142 @@
+import asyncio
 import os
+import threading
+from collections import OrderedDict
+import hashlib
 import logging
+import time
 import uuid
-from typing import List, Dict, Any
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+import numpy as np
+from fastembed import TextEmbedding
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 
+from ragforge.cache import ProximityCache
 from ragforge.settings import settings
 from ragforge.errors import RetrievalError, IngestionError
 
 logger = logging.getLogger(__name__)
 
-import atexit
+# Number of exact (query, limit) search results kept in memory
+SEARCH_CACHE_SIZE = 256
+
+# Seconds an empty-collection result is trusted before Qdrant is asked again
+EMPTY_CHECK_TTL = 60.0
+
+# Batches with more texts than this are embedded and uploaded by worker
+# processes when settings.embed_parallel / settings.upload_parallel are set;
+# smaller ones are not worth the process start-up
+PARALLEL_THRESHOLD = 512
+
+# Score candidates on the quantized vectors, then rescore the oversampled
+# top candidates with the original float32 vectors to keep recall
+# (ignored by collections created without quantization)
+SEARCH_PARAMS = models.SearchParams(
+    quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+
+def _quantization_config(mode: str) -> Optional[models.QuantizationConfig]:
+    """
+    Maps the ``vector_quantization`` setting to a Qdrant quantization config.
+    
+    The compressed vectors are kept in RAM for scoring; the float32 originals
+    stay on disk for rescoring the oversampled top candidates.
+    """
+    if mode == "int8":
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True
+            )
+        )
+    if mode == "binary":
+        # One bit per dimension; only accurate enough for high-dimensional models
+        return models.BinaryQuantization(binary=models.BinaryQuantizationConfig(always_ram=True))
+    if mode == "product":
+        # Each 16-byte slice of a vector becomes a one-byte centroid code;
+        # scoring sums precomputed query-to-centroid products
+        return models.ProductQuantization(
+            product=models.ProductQuantizationConfig(
+                compression=models.CompressionRatio.X16,
+                always_ram=True
+            )
+        )
+    return None
+
+
+@lru_cache(maxsize=1)
+def _get_embedder(model_name: str, cache_dir: str) -> TextEmbedding:
+    """
+    Loads and warms up the FastEmbed model once per process and reuses it afterwards.
+    
+    Args:
+        model_name: The FastEmbed model identifier.
+        cache_dir: Directory used to cache downloaded model files.
+        
+    Returns:
+        The shared TextEmbedding instance.
+    """
+    # Point FastEmbed's own cache lookups at the same directory, unless the
+    # user configured FASTEMBED_CACHE_PATH themselves
+    os.environ.setdefault("FASTEMBED_CACHE_PATH", cache_dir)
+    
+    # Run on the GPU when an onnxruntime build with CUDA is installed
+    # (e.g. via fastembed-gpu), falling back to the CPU for unsupported ops
+    import onnxruntime
+    
+    providers = None
+    if "CUDAExecutionProvider" in onnxruntime.get_available_providers():
+        providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+    embedder = TextEmbedding(model_name=model_name, cache_dir=cache_dir, providers=providers)
+    
+    # Run one tiny inference so ONNX Runtime's lazy setup (memory arenas,
+    # thread pools) happens now rather than on the first user query
+    try:
+        list(embedder.query_embed("warmup"))
+    except Exception as e:
+        logger.debug("Embedding model warmup failed: %s", e)
+    return embedder
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalizes vectors along the last axis.
+    
+    Stored and query vectors are unit length, so the collection can use
+    dot product, which equals cosine similarity for unit vectors, without
+    Qdrant normalizing at search time. Zero vectors are left unchanged.
+    """
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.clip(norms, 1e-12, None)
+
+
+def _point_id(text: str) -> str:
+    """
+    Derives a stable point ID from the text content.
+    
+    Identical texts always map to the same ID, so a text that is ingested
+    again can be detected and skipped instead of being stored twice.
+    """
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    return str(uuid.UUID(bytes=digest))
+
 
 class VectorStore:
     """
     Manages the Qdrant vector store using FastEmbed for embeddings.
     
     This class handles:
-    - Initialization of local Qdrant client
+    - Initialization of the Qdrant client (embedded local storage or server)
     - Collection creation with proper vector dimensions
     - Document ingestion with automatic embedding
     - Semantic search over ingested documents
+    - Approximate caching of search results for near-duplicate queries
     
     The vector store uses a singleton pattern via get_vector_store()
     to ensure only one instance is created.
@@ -29,96 +145,294 @@ class VectorStore:
     def __init__(self):
         """
         Initialize the Qdrant vector store client.
-        Creates the storage directory if it doesn't exist.
+        
+        Connects to a Qdrant server over gRPC when ``settings.qdrant_url`` is
+        set, otherwise uses embedded local storage and creates the storage
+        directory if it doesn't exist. The embedding model loads in the
+        background and is waited for on first use.
         """
-        # Initialize Qdrant Client (Local)
+        # Snapshot the settings used on every call, so hot paths read plain
+        # attributes instead of going through the settings model
+        self._collection = settings.collection_name
+        self._model = settings.embedding_model
+        self._dim = settings.embedding_dimension
+        self._embed_batch_size = settings.embed_batch_size
+        self._embed_parallel = settings.embed_parallel
+        self._upload_batch_size = settings.upload_batch_size
+        self._upload_parallel = settings.upload_parallel
+        
+        # Load the embedding model (ONNX session init, maybe a download) in
+        # the background: opening Qdrant does not need it, and callers that
+        # never embed (re-ingesting known texts, asking an empty store) never
+        # wait for it
+        loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ragforge-embedder")
+        self._embedder_future = loader.submit(_get_embedder, self._model, settings.fastembed_cache_path)
+        loader.shutdown(wait=False)
+        self._embedder = None
+        
+        location = settings.qdrant_url or settings.qdrant_path
         try:
-            os.makedirs(settings.qdrant_path, exist_ok=True)
-            self.client = QdrantClient(path=settings.qdrant_path)
-            # Set the model on the client to ensure it's loaded/configured
-            try:
-                self.client.set_model(settings.embedding_model)
-            except ValueError as e:
-                # Provide helpful error message for unsupported models
-                error_msg = str(e)
-                if "Unsupported embedding model" in error_msg:
-                    raise RetrievalError(
-                        f"Unsupported embedding model: '{settings.embedding_model}'. "
-                        f"Please check the Qdrant/FastEmbed documentation for supported models. "
-                        f"Common models include: 'sentence-transformers/all-MiniLM-L6-v2', "
-                        f"'nomic-ai/nomic-embed-text-v1.5', 'BAAI/bge-small-en-v1.5', etc. "
-                        f"Original error: {error_msg}"
-                    )
-                raise
-            
-            # Register cleanup
-            atexit.register(self.client.close)
-        except RetrievalError:
-            # Re-raise our custom errors
-            raise
+            if settings.qdrant_url:
+                # Initialize Qdrant Client (Server)
+                self.client = QdrantClient(
+                    url=settings.qdrant_url,
+                    prefer_grpc=True,
+                    grpc_port=settings.qdrant_grpc_port
+                )
+            else:
+                # Initialize Qdrant Client (Local)
+                if not os.path.isdir(settings.qdrant_path):
+                    os.makedirs(settings.qdrant_path, exist_ok=True)
+                self.client = QdrantClient(path=settings.qdrant_path)
         except Exception as e:
-            raise RetrievalError(f"Failed to initialize Qdrant client at {settings.qdrant_path}: {e}")
+            raise RetrievalError(f"Failed to initialize Qdrant client at {location}: {e}")
+        
+        # Close the client exactly once: on close(), when the store is garbage
+        # collected, or at interpreter exit
+        self._finalizer = weakref.finalize(self, self.client.close)
+
+        # Search results for semantically near-identical queries are reused
+        # Repeats of the exact same query skip even the query embedding
+        self._search_cache: "OrderedDict[tuple, List[str]]" = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        
+        # Once points exist they are never deleted, so only emptiness needs rechecking
+        self._has_points = False
+        self._empty_checked_at = None
+        
+        self.query_cache = None
+        if settings.query_cache_size > 0:
+            self.query_cache = ProximityCache(
+                self._dim,
+                max_size=settings.query_cache_size,
+                threshold=settings.query_cache_threshold
+            )
 
         self._ensure_collection()
 
+    @property
+    def embedder(self) -> TextEmbedding:
+        """
+        The FastEmbed model, waiting for the background load on first use.
+        
+        Raises:
+            RetrievalError: If the embedding model cannot be loaded.
+        """
+        embedder = self._embedder
+        if embedder is not None:
+            return embedder
+        try:
+            embedder = self._embedder_future.result()
+        except ValueError as e:
+            # Provide helpful error message for unsupported models
+            error_msg = str(e)
+            if "not supported" in error_msg:
+                raise RetrievalError(
+                    f"Unsupported embedding model: '{self._model}'. "
+                    f"Please check the Qdrant/FastEmbed documentation for supported models. "
+                    f"Common models include: 'sentence-transformers/all-MiniLM-L6-v2', "
+                    f"'nomic-ai/nomic-embed-text-v1.5', 'BAAI/bge-small-en-v1.5', etc. "
+                    f"Original error: {error_msg}"
+                )
+            raise RetrievalError(f"Failed to load embedding model '{self._model}': {e}")
+        except Exception as e:
+            raise RetrievalError(f"Failed to load embedding model '{self._model}': {e}")
+        self._embedder = embedder
+        return embedder
+
+    def close(self) -> None:
+        """Closes the Qdrant client. Safe to call more than once."""
+        self._finalizer()
+
+    def __enter__(self) -> "VectorStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def _ensure_collection(self):
         """
         Ensures the Qdrant collection exists with the correct configuration.
         Uses dynamic embedding dimension based on the configured model.
         """
         try:
-            if not self.client.collection_exists(settings.collection_name):
-                logger.info(f"Creating collection {settings.collection_name}...")
+            if not self.client.collection_exists(self._collection):
+                logger.info("Creating collection %s...", self._collection)
                 # Use dynamic embedding dimension from settings
-                dimension = settings.embedding_dimension
-                logger.info(f"Using embedding dimension {dimension} for model {settings.embedding_model}")
+                logger.info("Using embedding dimension %d for model %s", self._dim, self._model)
                 self.client.create_collection(
-                    collection_name=settings.collection_name,
+                    collection_name=self._collection,
                     vectors_config=models.VectorParams(
-                        size=dimension, 
-                        distance=models.Distance.COSINE
+                        size=self._dim, 
+                        # Vectors are normalized before upload, so dot product == cosine
+                        distance=models.Distance.DOT
                     ),
+                    hnsw_config=models.HnswConfigDiff(m=32, ef_construct=256),
+                    # Keep payloads (the raw texts) on disk to bound server RAM
+                    on_disk_payload=True,
+                    quantization_config=_quantization_config(settings.vector_quantization),
                 )
         except Exception as e:
             raise RetrievalError(f"Failed to verify/create collection: {e}")
 
-    def add_texts(self, texts: List[str]) -> None:
+    def filter_new_texts(self, texts: List[str]) -> List[str]:
+        """
+        Returns the texts that are not stored in the collection yet.
+        
+        Duplicates within ``texts`` are dropped as well. Only point IDs are
+        fetched, so this is much cheaper than embedding.
+        
+        Args:
+            texts: List of string documents.
+            
+        Returns:
+            The unique, not yet stored texts, in input order.
+            
+        Raises:
+            IngestionError: If the collection cannot be queried.
+        """
+        if not texts:
+            return []
+        
+        try:
+            # Content-addressed IDs dedupe the batch and let us skip known texts
+            ids_by_text = {text: _point_id(text) for text in texts}
+            stored = self.client.retrieve(
+                collection_name=self._collection,
+                ids=list(ids_by_text.values()),
+                with_payload=False,
+                with_vectors=False
+            )
+            stored_ids = {str(point.id) for point in stored}
+            return [text for text, point_id in ids_by_text.items() if point_id not in stored_ids]
+        except Exception as e:
+            raise IngestionError(f"Failed to check existing texts in vector store: {e}")
+
+    def add_texts(self, texts: List[str], skip_existing: bool = True) -> List[str]:
         """
         Embeds and adds texts to the vector store using FastEmbed.
         
+        Duplicate texts, both within ``texts`` and already stored in the
+        collection, are skipped. Texts are embedded in batches of
+        ``settings.embed_batch_size`` and streamed to Qdrant with
+        ``upload_collection`` in batches of ``settings.upload_batch_size``.
+        
         Args:
             texts: List of string documents to add.
+            skip_existing: Check for already stored texts first. Pass False
+                if ``texts`` already came from filter_new_texts().
+            
+        Returns:
+            The texts that were actually added, in input order.
         """
-        if not texts:
-            return
+        new_texts = self.filter_new_texts(texts) if skip_existing else texts
+        if not new_texts:
+            logger.debug("All texts are already in the vector store")
+            return []
 
         try:
-            points = [
-                models.PointStruct(
-                    id=str(uuid.uuid4()),
-                    vector=models.Document(
-                        text=text, 
-                        model=settings.embedding_model
-                    ),
-                    payload={
-                        "text": text,
-                        "document": text # Redundant but safe for different retrieval patterns
-                    }
-                )
-                for text in texts
-            ]
-
-            self.client.upsert(
-                collection_name=settings.collection_name,
-                points=points
+            # Keep embeddings as one (N, d) float32 array end to end: no boxed
+            # Python floats, one vectorized normalization, and qdrant-client
+            # slices the array into upload batches itself
+            parallel = self._embed_parallel if len(new_texts) > PARALLEL_THRESHOLD else None
+            vectors = np.asarray(
+                list(self.embedder.embed(new_texts, batch_size=self._embed_batch_size, parallel=parallel)),
+                dtype=np.float32
+            )
+            self.client.upload_collection(
+                collection_name=self._collection,
+                vectors=_normalize(vectors),
+                payload=({"text": text} for text in new_texts),
+                ids=[_point_id(text) for text in new_texts],
+                batch_size=self._upload_batch_size,
+                parallel=self._upload_parallel if len(new_texts) > PARALLEL_THRESHOLD else 1,
+                wait=True
             )
+            self._has_points = True
+            # New documents can change the results of any cached query
+            with self._search_cache_lock:
+                self._search_cache.clear()
+            if self.query_cache is not None:
+                self.query_cache.clear()
+            
+            return new_texts
         except Exception as e:
             raise IngestionError(f"Failed to add texts to vector store: {e}")
 
+    def is_empty(self) -> bool:
+        """
+        Returns whether the collection has no documents yet.
+        
+        The answer is cached: a non-empty collection stays non-empty, and an
+        empty one is only re-counted after EMPTY_CHECK_TTL seconds, in case
+        another process ingested into a shared Qdrant server meanwhile.
+        
+        Raises:
+            RetrievalError: If the collection cannot be counted.
+        """
+        if self._has_points:
+            return False
+        checked_at = self._empty_checked_at
+        if checked_at is not None and time.monotonic() - checked_at < EMPTY_CHECK_TTL:
+            return True
+        
+        try:
+            count = self.client.count(collection_name=self._collection, exact=False).count
+        except Exception as e:
+            raise RetrievalError(f"Failed to count documents in vector store: {e}")
+        if count:
+            self._has_points = True
+            return False
+        self._empty_checked_at = time.monotonic()
+        return True
+
+    def _recall_search(self, key: tuple) -> Optional[List[str]]:
+        """Returns a copy of the exact search result stored for key, if any."""
+        if SEARCH_CACHE_SIZE <= 0:
+            return None
+        with self._search_cache_lock:
+            texts = self._search_cache.get(key)
+            if texts is None:
+                return None
+            self._search_cache.move_to_end(key)
+            return list(texts)
+
+    def _remember_search(self, key: tuple, texts: List[str]) -> None:
+        """Stores an exact search result, evicting in LRU order."""
+        if SEARCH_CACHE_SIZE <= 0:
+            return
+        with self._search_cache_lock:
+            self._search_cache[key] = texts
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
+    async def aadd_texts(self, texts: List[str], skip_existing: bool = True) -> List[str]:
+        """
+        Async version of add_texts().
+        
+        Embedding and the upload run on a worker thread, so the event loop
+        keeps serving other requests meanwhile.
+        """
+        return await asyncio.to_thread(self.add_texts, texts, skip_existing)
+
+    async def asearch(self, query: str, limit: int = 5) -> List[str]:
+        """
+        Async version of search().
+        
+        The query embedding and the Qdrant request run on a worker thread, so
+        the event loop keeps serving other requests meanwhile.
+        """
+        return await asyncio.to_thread(self.search, query, limit)
+
     def search(self, query: str, limit: int = 5) -> List[str]:
         """
         Searches for relevant texts using FastEmbed.
         
+        Repeats of a recent query are answered from memory without embedding
+        it. Results of a previous query whose embedding is close enough to
+        this one are served from the query cache without contacting Qdrant.
+        
         Args:
             query: The question to answer.
             limit: Number of results to return.
@@ -126,23 +440,101 @@ class VectorStore:
         Returns:
             List of relevant text chunks.
         """
+        cache_key = (query, limit)
+        texts = self._recall_search(cache_key)
+        if texts is not None:
+            return texts
+        
         try:
+            # Keep the query as a contiguous float32 array; qdrant-client
+            # serializes ndarrays directly instead of walking a Python list
+            query_vector = np.ascontiguousarray(
+                _normalize(next(iter(self.embedder.query_embed(query)))), dtype=np.float32
+            )
+            
+            if self.query_cache is not None:
+                cached = self.query_cache.get(query_vector)
+                if cached is not None and cached[0] >= limit:
+                    texts = cached[1][:limit]
+                    self._remember_search(cache_key, texts)
+                    return list(texts)
+            
             result = self.client.query_points(
-                collection_name=settings.collection_name,
-                query=models.Document(
-                    text=query, 
-                    model=settings.embedding_model
-                ),
-                limit=limit
+                collection_name=self._collection,
+                query=query_vector,
+                limit=limit,
+                search_params=SEARCH_PARAMS
             )
             
-            hits = result.points
+            # Extract text from payload; every stored point has a "text" key
+            texts = [hit.payload["text"] for hit in result.points]
             
-            # Extract text from payload
-            return [
-                hit.payload.get("text", hit.payload.get("document", "")) 
-                for hit in hits 
-                if hit.payload
-            ]
+            if self.query_cache is not None:
+                self.query_cache.put(query_vector, (limit, texts))
+            self._remember_search(cache_key, texts)
+            
+            return list(texts)
         except Exception as e:
             raise RetrievalError(f"Search failed: {e}")
+
+    def search_batch(self, queries: List[str], limit: int = 5) -> List[List[str]]:
+        """
+        Searches for relevant texts for several queries at once.
+        
+        Queries not answered from the caches are embedded in one FastEmbed
+        call and sent to Qdrant in a single ``query_batch_points`` request,
+        instead of one model run and one round trip per query.
+        
+        Args:
+            queries: The questions to answer.
+            limit: Number of results to return per query.
+            
+        Returns:
+            One list of relevant text chunks per query, in the same order as ``queries``.
+        """
+        results: List[Optional[List[str]]] = [self._recall_search((query, limit)) for query in queries]
+        
+        pending = [i for i, texts in enumerate(results) if texts is None]
+        if not pending:
+            return results
+        
+        try:
+            query_vectors = _normalize(np.asarray(
+                list(self.embedder.query_embed([queries[i] for i in pending])), dtype=np.float32
+            ))
+            
+            to_search = []
+            for i, query_vector in zip(pending, query_vectors):
+                if self.query_cache is not None:
+                    cached = self.query_cache.get(query_vector)
+                    if cached is not None and cached[0] >= limit:
+                        texts = cached[1][:limit]
+                        self._remember_search((queries[i], limit), texts)
+                        results[i] = list(texts)
+                        continue
+                to_search.append((i, query_vector))
+            
+            if to_search:
+                responses = self.client.query_batch_points(
+                    collection_name=self._collection,
+                    requests=[
+                        models.QueryRequest(
+                            # Rows of the float32 batch, passed as ndarrays like in search()
+                            query=query_vector,
+                            limit=limit,
+                            params=SEARCH_PARAMS,
+                            with_payload=True
+                        )
+                        for _, query_vector in to_search
+                    ]
+                )
+                for (i, query_vector), response in zip(to_search, responses):
+                    texts = [hit.payload["text"] for hit in response.points]
+                    if self.query_cache is not None:
+                        self.query_cache.put(query_vector, (limit, texts))
+                    self._remember_search((queries[i], limit), texts)
+                    results[i] = list(texts)
+            
+            return results
+        except Exception as e:
+            raise RetrievalError(f"Batch search failed: {e}")